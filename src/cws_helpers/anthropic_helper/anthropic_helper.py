@@ -10,7 +10,7 @@ import time
 import json
 from typing import Dict, List, Optional, Union, Any, Iterable, Tuple, TypeVar, cast
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib.metadata import version
 from pathlib import Path
 
@@ -62,8 +62,9 @@ class ClaudeModel(str, Enum):
     CLAUDE_2_0 = "claude-2.0"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def default(cls) -> str:
-        """Return the default model."""
+        """Return the default model (cached after the first lookup)."""
         return cls.CLAUDE_3_5_SONNET_LATEST.value
 
 
@@ -6,14 +6,66 @@ log = configure_logging(__name__)
 
 # ------------------ Imports ------------------ #
 import os
+import threading
 import time
+from functools import cached_property
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
-from typing import List, Tuple, Dict, Optional, Union, Any
+from googleapiclient.model import JsonModel
+from typing import Callable, Iterator, List, Tuple, Dict, Optional, Union, Any
+
+# Use orjson to parse API responses when it is installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# MIME types of native Google Drive items
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+DOCUMENT_MIME_TYPE = "application/vnd.google-apps.document"
+
+# Maximum number of "'<id>' in parents" clauses combined into one Drive query
+MAX_PARENTS_PER_QUERY = 50
+
+# Maximum number of calls Google accepts in one batch HTTP request
+MAX_BATCH_REQUESTS = 100
+
+# Seconds a spreadsheet's first sheet name is reused before it is looked up again,
+# so sheets renamed or reordered elsewhere are picked up
+SHEET_NAME_CACHE_TTL = 60
+
+# Times googleapiclient retries a request that failed with a rate-limit (403/429)
+# or server (5xx) error, using randomized exponential backoff between attempts.
+# Only idempotent requests (get, list, update, clear, delete) are retried. Creates
+# and batch writes are sent once: a 5xx can arrive after the server has already
+# applied them, and retrying a create would leave a duplicate file or folder.
+NUM_RETRIES = 5
+
+
+class OrjsonModel(JsonModel):
+    """
+    googleapiclient JSON model that parses response bodies with orjson.
+    
+    Large listings and sheet reads spend most of their client-side CPU time
+    decoding JSON; orjson decodes straight from bytes and is faster than the
+    standard library parser used by the default JsonModel.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Mirror JsonModel, which returns bodies that aren't JSON as text
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
 
 
 class GoogleHelper:
@@ -62,13 +114,26 @@ class GoogleHelper:
         doc = google.docs.get_document("document_id")
     """
 
+    # Credentials shared by every GoogleHelper instance, keyed by their scopes
+    _credentials_cache: Dict[Tuple[str, ...], Credentials] = {}
+    _credentials_lock = threading.Lock()
+
+    # Raw discovery documents shared by every GoogleHelper instance, keyed by
+    # API and version. They are kept as JSON text because building a client adds
+    # parameters to the parsed document in place, so every build parses its own
+    # copy. Service clients themselves are not shared: each wraps an
+    # httplib2.Http, which is not thread-safe.
+    _discovery_cache: Dict[Tuple[str, str], Optional[str]] = {}
+    _discovery_lock = threading.Lock()
+
     def __init__(self, scopes: list = None, initialize_services: bool = True):
         """
         Initialize the Google Helper.
         
-        This constructor sets up the Google API client with the specified scopes,
-        handles authentication, and initializes service handlers for Sheets, Drive,
-        and Docs APIs.
+        This constructor sets up the Google API client with the specified scopes and
+        handles authentication. The Sheets, Drive, and Docs services are built lazily,
+        the first time their handler (or service) attribute is accessed, so scripts
+        only pay for the APIs they actually use.
         
         Args:
             scopes: Optional list of Google API scopes. If None, default scopes for 
@@ -76,8 +141,9 @@ class GoogleHelper:
                    - 'https://www.googleapis.com/auth/spreadsheets'
                    - 'https://www.googleapis.com/auth/drive'
                    - 'https://www.googleapis.com/auth/documents'
-            initialize_services: Whether to initialize service handlers during construction.
-                                 Set to False for testing purposes.
+            initialize_services: Whether the service handlers should build their services
+                                 on first access. Set to False for testing purposes, in
+                                 which case the handlers start without a service.
         
         Note:
             Authentication requires a 'credentials.json' file in the current directory.
@@ -91,16 +157,8 @@ class GoogleHelper:
         ]
         self._credentials = self._get_credentials()
         
-        # Initialize service handlers
-        if initialize_services:
-            self.sheets_service = self._get_service("sheets", "v4")
-            self.drive_service = self._get_service("drive", "v3")
-            self.docs_service = self._get_service("docs", "v1")
-            
-            self.sheets = self.SheetsHandler(self.sheets_service)
-            self.drive = self.DriveHandler(self.drive_service)
-            self.docs = self.DocsHandler(self.docs_service)
-        else:
+        # Service handlers are cached properties built on first access
+        if not initialize_services:
             # For testing purposes
             self.sheets_service = None
             self.drive_service = None
@@ -111,15 +169,48 @@ class GoogleHelper:
             self.drive = self.DriveHandler(None)
             self.docs = self.DocsHandler(None)
 
+    @cached_property
+    def sheets_service(self):
+        """Authenticated Google Sheets service, built on first access."""
+        return self._get_service("sheets", "v4")
+
+    @cached_property
+    def drive_service(self):
+        """Authenticated Google Drive service, built on first access."""
+        return self._get_service("drive", "v3")
+
+    @cached_property
+    def docs_service(self):
+        """Authenticated Google Docs service, built on first access."""
+        return self._get_service("docs", "v1")
+
+    @cached_property
+    def sheets(self) -> "GoogleHelper.SheetsHandler":
+        """Handler for Google Sheets operations."""
+        return self.SheetsHandler(self.sheets_service)
+
+    @cached_property
+    def drive(self) -> "GoogleHelper.DriveHandler":
+        """Handler for Google Drive operations."""
+        return self.DriveHandler(self.drive_service)
+
+    @cached_property
+    def docs(self) -> "GoogleHelper.DocsHandler":
+        """Handler for Google Docs operations."""
+        # Documents are placed in folders through the helper's own Drive service,
+        # which is only built if a folder operation actually needs it
+        return self.DocsHandler(self.docs_service, get_drive_service=lambda: self.drive_service)
+
     def _get_credentials(self):
         """
         Get and refresh Google OAuth2 credentials.
         
         This method handles the OAuth2 authentication flow for Google APIs:
-        1. Checks for existing credentials in 'token.json'
+        1. Reuses credentials already loaded for the same scopes by any GoogleHelper,
+           otherwise checks for existing credentials in 'token.json'
         2. Validates and refreshes expired credentials if possible
         3. Initiates a new authentication flow if needed
-        4. Saves new credentials to 'token.json'
+        4. Saves new or refreshed credentials to 'token.json'
         
         The authentication flow requires a 'credentials.json' file containing
         OAuth client configuration from the Google Cloud Console.
@@ -131,35 +222,71 @@ class GoogleHelper:
             FileNotFoundError: If credentials.json is missing.
             RefreshError: If token refresh fails and re-authentication is needed.
         """
-        credentials = None
-        if os.path.exists("token.json"):
-            credentials = Credentials.from_authorized_user_file("token.json", self.scopes)
-        
-        if not credentials or not credentials.valid:
-            if credentials and credentials.expired and credentials.refresh_token:
-                try:
-                    credentials.refresh(Request())
-                except RefreshError:
-                    log.info("Token refresh failed. Please re-authenticate.")
-                    credentials = None
-            
-            if not credentials:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    "credentials.json", self.scopes
-                )
-                credentials = flow.run_local_server(port=0)
+        cache_key = tuple(self.scopes)
+        with GoogleHelper._credentials_lock:
+            credentials = GoogleHelper._credentials_cache.get(cache_key)
+            if credentials is None and os.path.exists("token.json"):
+                credentials = Credentials.from_authorized_user_file("token.json", self.scopes)
             
-            with open("token.json", "w") as token:
-                token.write(credentials.to_json())
+            if not credentials or not credentials.valid:
+                if credentials and credentials.expired and credentials.refresh_token:
+                    try:
+                        credentials.refresh(Request())
+                    except RefreshError:
+                        log.info("Token refresh failed. Please re-authenticate.")
+                        credentials = None
+                
+                if not credentials:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        "credentials.json", self.scopes
+                    )
+                    credentials = flow.run_local_server(port=0)
+                
+                with open("token.json", "w") as token:
+                    token.write(credentials.to_json())
+            
+            GoogleHelper._credentials_cache[cache_key] = credentials
         
         return credentials
 
+    @classmethod
+    def clear_credentials_cache(cls):
+        """
+        Forget credentials shared between GoogleHelper instances.
+        
+        The next GoogleHelper created will load its credentials from 'token.json'
+        (or run the authentication flow) again.
+        """
+        with cls._credentials_lock:
+            cls._credentials_cache.clear()
+
+    @classmethod
+    def _get_discovery_document(cls, kind: str, version: str) -> Optional[str]:
+        """
+        Get the discovery document bundled with googleapiclient for an API, as JSON text.
+        
+        Documents are read from disk once per process and shared. They are not
+        parsed here: build_from_document() modifies the parsed document in place,
+        so each client is built from its own parse of the text. Returns None if no
+        document is bundled for the API.
+        """
+        with cls._discovery_lock:
+            key = (kind, version)
+            if key not in cls._discovery_cache:
+                cls._discovery_cache[key] = discovery_cache.get_static_doc(kind, version) or None
+            return cls._discovery_cache[key]
+
     def _get_service(self, kind: str, version: str):
         """
         Get an authenticated Google API service.
         
         This method creates and returns an authenticated service client for the
         specified Google API using the credentials obtained from _get_credentials().
+        The API's discovery document is read once per process and reused, but every
+        call parses it and builds a new client with its own HTTP connection. Clients are not
+        thread-safe, so give each thread its own GoogleHelper (the helper's service
+        attributes are built once per instance). If orjson is installed, the client
+        parses responses with it.
         
         Args:
             kind: The API service to get (e.g., "sheets", "drive", "docs")
@@ -173,8 +300,15 @@ class GoogleHelper:
                       network issues, authentication problems).
         """
         try:
-            service = build(kind, version, credentials=self._credentials)
-            return service
+            build_kwargs = {"credentials": self._credentials}
+            if HAS_ORJSON:
+                build_kwargs["model"] = OrjsonModel()
+            
+            document = self._get_discovery_document(kind, version)
+            if document is None:
+                # Not bundled with googleapiclient; let build() fetch it
+                return build(kind, version, **build_kwargs)
+            return build_from_document(document, **build_kwargs)
         except Exception as e:
             log.error(f"Error creating {kind} service: {str(e)}")
             raise
@@ -200,6 +334,15 @@ class GoogleHelper:
                 service: Authenticated Google Sheets service from googleapiclient.discovery.build()
             """
             self.service = service
+            # First sheet names already looked up, keyed by spreadsheet ID, with the
+            # time.monotonic() value they were fetched at
+            self._first_sheet_name_cache: Dict[str, Tuple[float, str]] = {}
+
+        @staticmethod
+        def _a1_range(sheet_name: Optional[str], start: Union[str, int], end: Union[str, int] = None) -> str:
+            """Build an A1 range such as "Sheet1!A1:B10", "A1" or "Sheet1!1:5000"."""
+            sheet_prefix = f"{sheet_name}!" if sheet_name else ""
+            return f"{sheet_prefix}{start}:{end}" if end else f"{sheet_prefix}{start}"
 
         def read_range(self, spreadsheet_id: str, range_name: str = None, sheet_name: str = None, 
                       start_cell: str = "A1", end_cell: str = None) -> list:
@@ -242,21 +385,94 @@ class GoogleHelper:
             try:
                 if not range_name:
                     # Construct range from components
-                    sheet_prefix = f"{sheet_name}!" if sheet_name else ""
-                    range_suffix = f"{start_cell}" if not end_cell else f"{start_cell}:{end_cell}"
-                    range_name = f"{sheet_prefix}{range_suffix}"
+                    range_name = self._a1_range(sheet_name, start_cell, end_cell)
 
                 result = (
                     self.service.spreadsheets()
                     .values()
                     .get(spreadsheetId=spreadsheet_id, range=range_name)
-                    .execute()
+                    .execute(num_retries=NUM_RETRIES)
                 )
                 return result.get("values", [])
             except Exception as e:
                 log.error(f"Error reading sheet: {str(e)}")
                 return []
 
+        def iter_range(self, spreadsheet_id: str, sheet_name: str = None, start_row: int = 1,
+                      end_row: int = None, chunk_size: int = 5000) -> Iterator[list]:
+            """
+            Read the rows of a sheet in chunks, yielding one row at a time.
+            
+            Unlike read_range, which returns the whole range as one list, this method
+            requests `chunk_size` rows at a time (e.g. "Sheet1!1:5000", then
+            "Sheet1!5001:10000"), so only one chunk is held in memory at once.
+            
+            Args:
+                spreadsheet_id: ID of the spreadsheet (the long string in the sheet URL).
+                sheet_name: Name of sheet to read from. If None, reads from first sheet.
+                start_row: First row to read (1-based). Defaults to 1.
+                end_row: Last row to read. If None, reads until a chunk comes back empty.
+                chunk_size: Number of rows to request at a time. Defaults to 5000.
+                
+            Yields:
+                Each row as a list of values. Empty rows between rows with data are
+                yielded as empty lists, so row positions are preserved. Reading stops
+                early (after logging the error) if a request fails.
+                
+            Raises:
+                ValueError: If start_row or chunk_size is less than 1.
+                
+            Example:
+                ```python
+                for row in google.sheets.iter_range(
+                    spreadsheet_id='your_spreadsheet_id',
+                    sheet_name='Sheet1',
+                    start_row=2
+                ):
+                    process(row)
+                ```
+            """
+            # Checked here rather than in the generator, so bad arguments fail on the call
+            if start_row < 1:
+                raise ValueError(f"start_row must be at least 1, got {start_row}")
+            if chunk_size < 1:
+                raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+            return self._iter_rows(spreadsheet_id, sheet_name, start_row, end_row, chunk_size)
+
+        def _iter_rows(self, spreadsheet_id: str, sheet_name: Optional[str], start_row: int,
+                       end_row: Optional[int], chunk_size: int) -> Iterator[list]:
+            """Generator behind iter_range; expects already validated arguments."""
+            # Empty rows at the end of a chunk are trimmed by the API; they are only
+            # yielded once a later chunk shows they weren't the end of the data
+            pending_empty_rows = 0
+            row = start_row
+            while end_row is None or row <= end_row:
+                last_row = row + chunk_size - 1
+                if end_row is not None:
+                    last_row = min(last_row, end_row)
+                
+                try:
+                    result = (
+                        self.service.spreadsheets()
+                        .values()
+                        .get(spreadsheetId=spreadsheet_id, range=self._a1_range(sheet_name, row, last_row))
+                        .execute(num_retries=NUM_RETRIES)
+                    )
+                except Exception as e:
+                    log.error(f"Error reading sheet rows {row}-{last_row}: {str(e)}")
+                    return
+                
+                rows = result.get("values", [])
+                if not rows and end_row is None:
+                    return
+                if rows:
+                    for _ in range(pending_empty_rows):
+                        yield []
+                    pending_empty_rows = 0
+                    yield from rows
+                pending_empty_rows += (last_row - row + 1) - len(rows)
+                row = last_row + 1
+
         def write_range(self, spreadsheet_id: str, values: list, range_name: str = None,
                        sheet_name: str = None, start_cell: str = "A1", 
                        input_option: str = "RAW", rate_limit: float = 1.0):
@@ -300,8 +516,7 @@ class GoogleHelper:
             try:
                 if not range_name:
                     # Construct range from components
-                    sheet_prefix = f"{sheet_name}!" if sheet_name else ""
-                    range_name = f"{sheet_prefix}{start_cell}"
+                    range_name = self._a1_range(sheet_name, start_cell)
 
                 body = {"values": values}
                 self.service.spreadsheets().values().update(
@@ -309,7 +524,7 @@ class GoogleHelper:
                     range=range_name,
                     valueInputOption=input_option,
                     body=body,
-                ).execute()
+                ).execute(num_retries=NUM_RETRIES)
                 
                 if rate_limit > 0:
                     time.sleep(rate_limit)
@@ -318,6 +533,189 @@ class GoogleHelper:
                 log.error(f"Error writing to sheet: {e}")
                 raise
 
+        def read_ranges(self, spreadsheet_id: str, ranges: List[str]) -> List[list]:
+            """
+            Read data from several ranges of a spreadsheet in a single request.
+
+            This method uses the Sheets `values.batchGet` endpoint, so reading N ranges
+            costs one API call instead of N separate `read_range` calls.
+
+            Args:
+                spreadsheet_id: ID of the spreadsheet (the long string in the sheet URL).
+                ranges: Ranges to read in A1 notation (e.g., ["Sheet1!A1:B10", "Sheet2!A:C"]).
+
+            Returns:
+                A list with one entry per requested range, in the same order. Each entry
+                is a list of rows, where each row is a list of values. Empty ranges (or
+                all ranges, if an error occurs) are returned as empty lists.
+
+            Example:
+                ```python
+                summary, details = google.sheets.read_ranges(
+                    spreadsheet_id='your_spreadsheet_id',
+                    ranges=['Summary!A1:D10', 'Details!A1:F100']
+                )
+                ```
+            """
+            try:
+                result = (
+                    self.service.spreadsheets()
+                    .values()
+                    .batchGet(spreadsheetId=spreadsheet_id, ranges=list(ranges))
+                    .execute(num_retries=NUM_RETRIES)
+                )
+                value_ranges = result.get("valueRanges", [])
+                return [value_range.get("values", []) for value_range in value_ranges]
+            except Exception as e:
+                log.error(f"Error reading sheet ranges: {str(e)}")
+                return [[] for _ in ranges]
+
+        def write_ranges(self, spreadsheet_id: str, data: Dict[str, list],
+                        input_option: str = "RAW", rate_limit: float = 1.0):
+            """
+            Write data to several ranges of a spreadsheet in a single request.
+
+            This method uses the Sheets `values.batchUpdate` endpoint, so writing N ranges
+            counts as one write request against the per-minute quota instead of N.
+
+            Args:
+                spreadsheet_id: ID of the spreadsheet (the long string in the sheet URL).
+                data: Mapping of range (e.g., "Sheet1!A1") to the rows to write there.
+                input_option: How input should be interpreted:
+                             - "RAW": Values are stored as-is
+                             - "USER_ENTERED": Values are parsed as if typed by a user
+                rate_limit: Seconds to wait after write (for rate limiting).
+
+            Raises:
+                Exception: If the write operation fails.
+
+            Example:
+                ```python
+                google.sheets.write_ranges(
+                    spreadsheet_id='your_spreadsheet_id',
+                    data={
+                        'Summary!A1': [['Total', 42]],
+                        'Details!A1': [['Name', 'Count'], ['apples', 42]],
+                    }
+                )
+                ```
+            """
+            try:
+                body = {
+                    "valueInputOption": input_option,
+                    "data": [
+                        {"range": range_name, "values": values}
+                        for range_name, values in data.items()
+                    ],
+                }
+                self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body,
+                ).execute()
+
+                if rate_limit > 0:
+                    time.sleep(rate_limit)
+
+            except Exception as e:
+                log.error(f"Error writing sheet ranges: {e}")
+                raise
+
+        def append_rows(self, spreadsheet_id: str, rows: List[list], sheet_name: str = None,
+                       column: str = "A", input_option: str = "RAW", rate_limit: float = 1.0) -> str:
+            """
+            Append rows after the last row with data in a sheet.
+            
+            This method uses the Sheets `values.append` endpoint, which finds the end
+            of the data and writes every row in a single request, however many rows
+            there are. Appending rows one at a time quickly runs into the per-minute
+            write quota.
+            
+            Args:
+                spreadsheet_id: ID of the spreadsheet (the long string in the sheet URL).
+                rows: The rows to append, where each row is a list of values.
+                sheet_name: Name of sheet to append to. If None, appends to first sheet.
+                column: Column the table starts in (e.g., "A", "B"). Defaults to "A".
+                input_option: How input should be interpreted:
+                             - "RAW": Values are stored as-is
+                             - "USER_ENTERED": Values are parsed as if typed by a user
+                rate_limit: Seconds to wait after write (for rate limiting).
+                
+            Returns:
+                The range the rows were written to in A1 notation (e.g., "Sheet1!A5:C7").
+                
+            Raises:
+                Exception: If the append operation fails.
+                
+            Example:
+                ```python
+                google.sheets.append_rows(
+                    spreadsheet_id='your_spreadsheet_id',
+                    rows=[
+                        ['apples', 3],
+                        ['pears', 5]
+                    ],
+                    sheet_name='Sheet1'
+                )
+                ```
+            """
+            try:
+                # Appends are not retried: a failed attempt may already have added the rows
+                result = self.service.spreadsheets().values().append(
+                    spreadsheetId=spreadsheet_id,
+                    range=self._a1_range(sheet_name, column, column),
+                    valueInputOption=input_option,
+                    insertDataOption="INSERT_ROWS",
+                    body={"values": rows},
+                ).execute()
+                
+                if rate_limit > 0:
+                    time.sleep(rate_limit)
+                
+                return result.get("updates", {}).get("updatedRange", "")
+            except Exception as e:
+                log.error(f"Error appending to sheet: {e}")
+                raise
+
+        def append_row(self, spreadsheet_id: str, values: list, sheet_name: str = None,
+                      column: str = "A", input_option: str = "RAW", rate_limit: float = 1.0) -> str:
+            """
+            Append a row after the last row with data in a sheet.
+            
+            This is a convenience method that calls append_rows with a single row. Use
+            it instead of calling get_next_empty_row and then write_range, which reads
+            the whole column before writing. To add several rows, pass them all to
+            append_rows rather than calling this method for each one.
+            
+            Args:
+                spreadsheet_id: ID of the spreadsheet (the long string in the sheet URL).
+                values: The values of the row to append.
+                sheet_name: Name of sheet to append to. If None, appends to first sheet.
+                column: Column the table starts in (e.g., "A", "B"). Defaults to "A".
+                input_option: How input should be interpreted:
+                             - "RAW": Values are stored as-is
+                             - "USER_ENTERED": Values are parsed as if typed by a user
+                rate_limit: Seconds to wait after write (for rate limiting).
+                
+            Returns:
+                The range the row was written to in A1 notation (e.g., "Sheet1!A5:C5").
+                
+            Raises:
+                Exception: If the append operation fails.
+                
+            Example:
+                ```python
+                google.sheets.append_row(
+                    spreadsheet_id='your_spreadsheet_id',
+                    values=['New', 'Data', 'Row'],
+                    sheet_name='Sheet1'
+                )
+                ```
+            """
+            return self.append_rows(
+                spreadsheet_id, [values], sheet_name=sheet_name, column=column,
+                input_option=input_option, rate_limit=rate_limit
+            )
+
         def clear_range(self, spreadsheet_id: str, range_name: str = None,
                        sheet_name: str = None, start_cell: str = None, 
                        end_cell: str = None, preserve_headers: bool = False):
@@ -363,30 +761,23 @@ class GoogleHelper:
             """
             try:
                 if not range_name:
-                    # Construct range from components
-                    sheet_prefix = f"{sheet_name}!" if sheet_name else ""
-                    if start_cell and end_cell:
-                        range_suffix = f"{start_cell}:{end_cell}"
-                    elif start_cell:
-                        range_suffix = start_cell
+                    # Construct range from components; end_cell only applies with a start_cell
+                    if start_cell:
+                        range_name = self._a1_range(sheet_name, start_cell, end_cell)
                     else:
-                        range_suffix = "A1"
-                    range_name = f"{sheet_prefix}{range_suffix}"
+                        range_name = self._a1_range(sheet_name, "A1")
                 
                 if preserve_headers:
                     # Get the current range data
                     values = self.read_range(spreadsheet_id, range_name)
                     if values and len(values) > 1:
-                        # Keep the header row and clear the rest
-                        header = values[0]
-                        self.service.spreadsheets().values().clear(
-                            spreadsheetId=spreadsheet_id,
-                            range=range_name,
-                        ).execute()
-                        # Write back the header row
+                        # Clear the rest in a single write: the API skips null values,
+                        # so the header row is left as it is, and an empty string
+                        # clears each cell below it that currently holds a value
+                        blanked = [[None] * len(values[0])] + [[""] * len(row) for row in values[1:]]
                         self.write_range(
                             spreadsheet_id=spreadsheet_id,
-                            values=[header],
+                            values=blanked,
                             range_name=range_name,
                         )
                 else:
@@ -394,7 +785,7 @@ class GoogleHelper:
                     self.service.spreadsheets().values().clear(
                         spreadsheetId=spreadsheet_id,
                         range=range_name,
-                    ).execute()
+                    ).execute(num_retries=NUM_RETRIES)
             except Exception as e:
                 log.error(f"Error clearing range: {e}")
                 raise
@@ -414,6 +805,10 @@ class GoogleHelper:
                 The name of the first sheet as a string. Returns an empty string if
                 an error occurs or if the spreadsheet has no sheets.
                 
+            Note:
+                The name is cached per spreadsheet for SHEET_NAME_CACHE_TTL seconds, so
+                repeated calls within that window make no API requests.
+                
             Example:
                 ```python
                 # Get the name of the first sheet in a spreadsheet
@@ -422,13 +817,21 @@ class GoogleHelper:
                 )
                 ```
             """
+            cached = self._first_sheet_name_cache.get(spreadsheet_id)
+            if cached and time.monotonic() - cached[0] < SHEET_NAME_CACHE_TTL:
+                return cached[1]
+            
             try:
+                # Only the sheet titles are needed, not the full spreadsheet metadata
                 spreadsheet = self.service.spreadsheets().get(
-                    spreadsheetId=spreadsheet_id
-                ).execute()
+                    spreadsheetId=spreadsheet_id,
+                    fields="sheets.properties.title"
+                ).execute(num_retries=NUM_RETRIES)
                 
                 if spreadsheet and "sheets" in spreadsheet and len(spreadsheet["sheets"]) > 0:
-                    return spreadsheet["sheets"][0]["properties"]["title"]
+                    title = spreadsheet["sheets"][0]["properties"]["title"]
+                    self._first_sheet_name_cache[spreadsheet_id] = (time.monotonic(), title)
+                    return title
                 return ""
             except Exception as e:
                 log.error(f"Error getting first sheet name: {str(e)}")
@@ -461,7 +864,8 @@ class GoogleHelper:
                     column='A'
                 )
                 
-                # Use the next empty row to append data
+                # Use the next empty row to append data (append_row does
+                # this in a single request)
                 google.sheets.write_range(
                     spreadsheet_id='your_spreadsheet_id',
                     values=[['New', 'Data', 'Row']],
@@ -471,16 +875,13 @@ class GoogleHelper:
                 ```
             """
             try:
-                # If no sheet name provided, get the first sheet
-                if not sheet_name:
-                    sheet_name = self.get_first_sheet_name(spreadsheet_id)
-                
-                # Get all values in the specified column
-                range_name = f"{sheet_name}!{column}:{column}"
+                # Get all values in the specified column. A range without a sheet
+                # name refers to the first sheet, so its name needn't be looked up.
+                range_name = self._a1_range(sheet_name, column, column)
                 result = self.service.spreadsheets().values().get(
                     spreadsheetId=spreadsheet_id,
                     range=range_name
-                ).execute()
+                ).execute(num_retries=NUM_RETRIES)
                 
                 values = result.get("values", [])
                 return len(values) + 1  # 1-indexed row number
@@ -580,14 +981,111 @@ class GoogleHelper:
         rather than raising exceptions, to prevent application crashes.
         """
         
-        def __init__(self, service):
+        def __init__(self, service, shared_drives: bool = True):
             """
             Initialize with an authenticated Google Drive service.
             
             Args:
                 service: Authenticated Google Drive service from googleapiclient.discovery.build()
+                shared_drives: Whether requests should include files in shared drives
+                              (supportsAllDrives / includeItemsFromAllDrives). This is
+                              harmless for accounts without shared drives. Defaults to True.
             """
             self.service = service
+            self.shared_drives = shared_drives
+            # Folder IDs already looked up, keyed by (folder name, parent ID)
+            self._folder_id_cache: Dict[Tuple[str, str], str] = {}
+
+        @property
+        def _list_options(self) -> Dict[str, bool]:
+            """Extra files().list arguments for searching shared drives too."""
+            if not self.shared_drives:
+                return {}
+            return {"supportsAllDrives": True, "includeItemsFromAllDrives": True}
+
+        @property
+        def _write_options(self) -> Dict[str, bool]:
+            """Extra files().create/delete arguments for items in shared drives."""
+            return {"supportsAllDrives": True} if self.shared_drives else {}
+
+        def _forget_folder_id(self, folder_id: str):
+            """Drop every cached folder lookup that resolved to folder_id."""
+            for key in [key for key, value in self._folder_id_cache.items() if value == folder_id]:
+                del self._folder_id_cache[key]
+
+        def _list_all_files(self, query: str, 
+                            fields: str = "nextPageToken, files(id, name, mimeType, parents)") -> List[Dict[str, Any]]:
+            """
+            Run a Drive search and collect every page of results.
+            
+            Args:
+                query: Drive search query string.
+                fields: Fields to request. Must include nextPageToken so that
+                       further pages can be fetched.
+                
+            Returns:
+                List of file metadata dictionaries from all pages.
+            """
+            files = []
+            page_token = None
+            while True:
+                response = self.service.files().list(
+                    q=query,
+                    fields=fields,
+                    pageToken=page_token,
+                    **self._list_options
+                ).execute(num_retries=NUM_RETRIES)
+                files.extend(response.get("files", []))
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return files
+
+        def _list_subtree(self, folder_id: str, mime_filter: str = None) -> Dict[str, List[Dict[str, Any]]]:
+            """
+            Fetch the contents of a folder tree, one Drive query per depth level.
+            
+            Rather than listing each folder separately, every folder found at one
+            level is combined into a single "'a' in parents or 'b' in parents"
+            query for the next level (in chunks of MAX_PARENTS_PER_QUERY).
+            
+            Args:
+                folder_id: ID of the folder at the top of the tree.
+                mime_filter: Optional query clause restricting the returned items,
+                            e.g. "mimeType='...folder' or mimeType='...document'".
+                            It must still match folders for the walk to descend.
+                
+            Returns:
+                Dictionary mapping each folder ID to the list of its children's
+                metadata, in the order the API returned them.
+            """
+            children = {}
+            seen = {folder_id}
+            level = [folder_id]
+            while level:
+                next_level = []
+                for start in range(0, len(level), MAX_PARENTS_PER_QUERY):
+                    parents = level[start:start + MAX_PARENTS_PER_QUERY]
+                    query = " or ".join(f"'{parent}' in parents" for parent in parents)
+                    if mime_filter:
+                        query = f"({query}) and ({mime_filter})"
+                    
+                    for item in self._list_all_files(query):
+                        # The API reports the real ID of "root", so fall back to
+                        # the only (or the "root") parent we asked about
+                        matched = [parent for parent in item.get("parents", []) if parent in parents]
+                        if not matched:
+                            if len(parents) == 1:
+                                matched = parents
+                            elif "root" in parents:
+                                matched = ["root"]
+                        for parent in matched:
+                            children.setdefault(parent, []).append(item)
+                        
+                        if item.get("mimeType") == FOLDER_MIME_TYPE and item["id"] not in seen:
+                            seen.add(item["id"])
+                            next_level.append(item["id"])
+                level = next_level
+            return children
 
         def list_files(self, query: str = None, page_size: int = 10, fields: str = None):
             """
@@ -631,8 +1129,9 @@ class GoogleHelper:
                 results = self.service.files().list(
                     q=query,
                     pageSize=page_size,
-                    fields=fields
-                ).execute()
+                    fields=fields,
+                    **self._list_options
+                ).execute(num_retries=NUM_RETRIES)
                 
                 return results.get("files", [])
             except Exception as e:
@@ -686,9 +1185,13 @@ class GoogleHelper:
                 
                 folder = self.service.files().create(
                     body=file_metadata,
-                    fields="id, name, mimeType"
+                    fields="id, name, mimeType",
+                    **self._write_options
                 ).execute()
                 
+                # A new folder may now be the one a name lookup should find
+                self._folder_id_cache.pop((name, parent_id or "root"), None)
+                
                 return folder
             except Exception as e:
                 log.error(f"Error creating folder: {str(e)}")
@@ -700,7 +1203,8 @@ class GoogleHelper:
             
             This method traverses a folder and all its subfolders to find all files.
             It's useful for creating a complete inventory of files in a folder structure.
-            You can optionally filter by file type using the MIME type.
+            You can optionally filter by file type using the MIME type. The tree is
+            fetched with one Drive query per folder depth rather than per folder.
             
             Args:
                 folder_id: ID of the folder to start the search from. Defaults to "root"
@@ -731,32 +1235,30 @@ class GoogleHelper:
                 ```
             """
             try:
-                # Query for all files in the current folder
-                file_query = f"'{folder_id}' in parents"
-                if file_type:
-                    file_query += f" and mimeType='{file_type}'"
-                else:
-                    file_query += f" and mimeType!='application/vnd.google-apps.folder'"
-                
-                files = self.service.files().list(
-                    q=file_query,
-                    fields="files(id, name, mimeType)"
-                ).execute().get("files", [])
-                
-                all_files = [(file["id"], file["name"]) for file in files]
-                
-                # Query for all subfolders in the current folder
-                folder_query = f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.folder'"
-                folders = self.service.files().list(
-                    q=folder_query,
-                    fields="files(id, name)"
-                ).execute().get("files", [])
-                
-                # Recursively list all files in each subfolder
-                for folder in folders:
-                    all_files.extend(self.list_all_files_recursive(folder_id=folder["id"], file_type=file_type))
-                
-                return all_files
+                # Folders are always needed to keep descending; other files only
+                # when they match the requested type
+                mime_filter = None
+                if file_type == FOLDER_MIME_TYPE:
+                    mime_filter = f"mimeType='{FOLDER_MIME_TYPE}'"
+                elif file_type:
+                    mime_filter = f"mimeType='{FOLDER_MIME_TYPE}' or mimeType='{file_type}'"
+                children = self._list_subtree(folder_id, mime_filter=mime_filter)
+                
+                def collect(parent_id: str) -> List[Tuple[str, str]]:
+                    items = children.get(parent_id, [])
+                    # Without a file_type every non-folder matches; with one, only that
+                    # type does (which may itself be the folder type)
+                    files = [
+                        (item["id"], item["name"]) for item in items
+                        if (item.get("mimeType") == file_type if file_type
+                            else item.get("mimeType") != FOLDER_MIME_TYPE)
+                    ]
+                    for item in items:
+                        if item.get("mimeType") == FOLDER_MIME_TYPE:
+                            files.extend(collect(item["id"]))
+                    return files
+                
+                return collect(folder_id)
             except Exception as e:
                 log.error(f"Error listing files recursively: {str(e)}")
                 return []
@@ -766,7 +1268,8 @@ class GoogleHelper:
             Recursively list all folders in Google Drive.
             
             This method traverses a folder and all its subfolders to find all folders.
-            It's useful for creating a complete inventory of the folder structure.
+            It's useful for creating a complete inventory of the folder structure. The
+            tree is fetched with one Drive query per folder depth rather than per folder.
             
             Args:
                 folder_id: ID of the folder to start the search from. Defaults to "root"
@@ -790,20 +1293,17 @@ class GoogleHelper:
                 ```
             """
             try:
-                # Query for all folders in the current folder
-                folder_query = f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.folder'"
-                folders = self.service.files().list(
-                    q=folder_query,
-                    fields="files(id, name)"
-                ).execute().get("files", [])
+                children = self._list_subtree(folder_id, mime_filter=f"mimeType='{FOLDER_MIME_TYPE}'")
                 
-                all_folders = [(folder["id"], folder["name"]) for folder in folders]
+                # Each folder is followed by its own subfolders, depth first
+                def collect(parent_id: str) -> List[Tuple[str, str]]:
+                    folders = []
+                    for item in children.get(parent_id, []):
+                        folders.append((item["id"], item["name"]))
+                        folders.extend(collect(item["id"]))
+                    return folders
                 
-                # Recursively list all folders in each subfolder
-                for folder in folders:
-                    all_folders.extend(self.list_all_folders_recursive(folder_id=folder["id"]))
-                
-                return all_folders
+                return collect(folder_id)
             except Exception as e:
                 log.error(f"Error listing folders recursively: {str(e)}")
                 return []
@@ -814,7 +1314,8 @@ class GoogleHelper:
             
             This method searches for a folder with the specified name in a parent folder.
             If the folder is not found, it can optionally create it. This is useful for
-            ensuring that a folder exists before trying to use it.
+            ensuring that a folder exists before trying to use it. Found folder IDs are
+            cached on the handler, so repeat lookups make no API calls.
             
             Args:
                 folder_name: Name of the folder to find.
@@ -846,19 +1347,26 @@ class GoogleHelper:
                 ```
             """
             try:
+                cache_key = (folder_name, parent_id)
+                if cache_key in self._folder_id_cache:
+                    return self._folder_id_cache[cache_key]
+                
                 # Check if the folder exists
                 folder_query = f"name='{folder_name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder'"
                 folders = self.service.files().list(
                     q=folder_query,
-                    fields="files(id, name)"
-                ).execute().get("files", [])
+                    fields="files(id, name)",
+                    **self._list_options
+                ).execute(num_retries=NUM_RETRIES).get("files", [])
                 
                 if folders:
+                    self._folder_id_cache[cache_key] = folders[0]["id"]
                     return folders[0]["id"]
                 
                 # Create the folder if requested and not found
                 if create_if_missing:
                     folder = self.create_folder(folder_name, parent_id)
+                    self._folder_id_cache[cache_key] = folder["id"]
                     return folder["id"]
                 
                 return None
@@ -874,6 +1382,11 @@ class GoogleHelper:
             You can specify the folder either by name or by ID, and optionally
             filter by file type.
             
+            When the folder is given by name (and its ID isn't cached yet), the folder
+            and the file are looked up with one query. That query matches every file
+            with this name anywhere in the Drive, so if the name is very common, pass
+            folder_id (or look the folder up with get_folder_id first) instead.
+            
             Args:
                 file_name: Name of the file to find.
                 folder_name: Name of the folder to search in (mutually exclusive with folder_id).
@@ -908,27 +1421,54 @@ class GoogleHelper:
                 ```
             """
             try:
-                # Get folder ID if folder name is provided
+                file_query = f"name='{file_name}'"
+                if file_type:
+                    file_query += f" and mimeType='{file_type}'"
+                
                 if folder_name and not folder_id:
-                    folder_id = self.get_folder_id(folder_name)
+                    folder_id = self._folder_id_cache.get((folder_name, "root"))
+                    if not folder_id and folder_name == file_name:
+                        # A same-named result could be the folder or the file, so
+                        # resolve the folder on its own first
+                        folder_id = self.get_folder_id(folder_name)
+                        if not folder_id:
+                            log.error(f"Folder '{folder_name}' not found.")
+                            return None
+                
+                if folder_name and not folder_id:
+                    # Look up the folder and the file in a single request, then
+                    # keep only the files whose parent is the matched folder. Any
+                    # folder named folder_name in the results came from the folder
+                    # clause, which already restricts it to the root of the Drive
+                    # (Drive reports the root's real ID in "parents", not "root").
+                    folder_query = f"name='{folder_name}' and 'root' in parents and mimeType='{FOLDER_MIME_TYPE}'"
+                    results = self._list_all_files(f"({folder_query}) or ({file_query})")
+                    
+                    folder_id = next(
+                        (item["id"] for item in results
+                         if item.get("mimeType") == FOLDER_MIME_TYPE
+                         and item.get("name") == folder_name),
+                        None
+                    )
                     if not folder_id:
                         log.error(f"Folder '{folder_name}' not found.")
                         return None
-                
-                # Default to root if no folder specified
-                if not folder_id:
-                    folder_id = "root"
-                
-                # Build query
-                file_query = f"name='{file_name}' and '{folder_id}' in parents"
-                if file_type:
-                    file_query += f" and mimeType='{file_type}'"
-                
-                # Search for the file
-                files = self.service.files().list(
-                    q=file_query,
-                    fields="files(id, name)"
-                ).execute().get("files", [])
+                    self._folder_id_cache[(folder_name, "root")] = folder_id
+                    
+                    files = [
+                        item for item in results
+                        if item.get("name") == file_name
+                        and folder_id in item.get("parents", [])
+                        and (not file_type or item.get("mimeType") == file_type)
+                    ]
+                else:
+                    # Default to root if no folder specified
+                    folder_id = folder_id or "root"
+                    files = self.service.files().list(
+                        q=f"{file_query} and '{folder_id}' in parents",
+                        fields="files(id, name)",
+                        **self._list_options
+                    ).execute(num_retries=NUM_RETRIES).get("files", [])
                 
                 if not files:
                     log.error(f"File '{file_name}' not found in the specified folder.")
@@ -999,8 +1539,9 @@ class GoogleHelper:
                 # Get files in the folder
                 files = self.service.files().list(
                     q=file_query,
-                    fields="files(id, name, mimeType)"
-                ).execute().get("files", [])
+                    fields="files(id, name)",
+                    **self._list_options
+                ).execute(num_retries=NUM_RETRIES).get("files", [])
                 
                 file_list = [(file["id"], file["name"]) for file in files]
                 
@@ -1037,12 +1578,62 @@ class GoogleHelper:
                 ```
             """
             try:
-                self.service.files().delete(fileId=file_id).execute()
+                self.service.files().delete(fileId=file_id, **self._write_options).execute(num_retries=NUM_RETRIES)
+                self._forget_folder_id(file_id)
                 return True
             except Exception as e:
                 log.error(f"Error deleting file: {str(e)}")
                 return False
 
+        def delete_files(self, file_ids: List[str]) -> Dict[str, bool]:
+            """
+            Delete several files or folders from Google Drive.
+            
+            The deletions are sent as batch HTTP requests of up to MAX_BATCH_REQUESTS
+            calls each, so deleting K files takes about K/100 round trips instead of K.
+            Use with caution as this operation cannot be undone.
+            
+            Args:
+                file_ids: IDs of the files or folders to delete.
+                
+            Returns:
+                Dictionary mapping each file ID to True if it was deleted, False otherwise.
+                
+            Example:
+                ```python
+                results = google.drive.delete_files(['file_id_1', 'file_id_2'])
+                failed = [file_id for file_id, deleted in results.items() if not deleted]
+                ```
+            """
+            # Batch request IDs must be unique, so each file is deleted only once
+            file_ids = list(dict.fromkeys(file_ids))
+            results = {}
+            
+            def record(request_id, response, exception):
+                if exception is not None:
+                    log.error(f"Error deleting file {request_id}: {str(exception)}")
+                results[request_id] = exception is None
+            
+            for start in range(0, len(file_ids), MAX_BATCH_REQUESTS):
+                chunk = file_ids[start:start + MAX_BATCH_REQUESTS]
+                try:
+                    batch = self.service.new_batch_http_request(callback=record)
+                    for file_id in chunk:
+                        batch.add(
+                            self.service.files().delete(fileId=file_id, **self._write_options),
+                            request_id=file_id
+                        )
+                    batch.execute()
+                except Exception as e:
+                    log.error(f"Error deleting files: {str(e)}")
+                for file_id in chunk:
+                    results.setdefault(file_id, False)
+            
+            for file_id, deleted in results.items():
+                if deleted:
+                    self._forget_folder_id(file_id)
+            return results
+
     class DocsHandler:
         """
         Handler for Google Docs operations.
@@ -1053,28 +1644,54 @@ class GoogleHelper:
         All methods include comprehensive error handling and logging to help with debugging.
         """
         
-        def __init__(self, service):
+        def __init__(self, service, get_drive_service: Callable[[], Any] = None):
             """
             Initialize with an authenticated Google Docs service.
             
             Args:
                 service: Authenticated Google Docs service from googleapiclient.discovery.build()
+                get_drive_service: Optional callable returning the Drive service used to
+                                  place documents in folders. If None, a Drive service is
+                                  built from the Docs service's credentials when first needed.
             """
             self.service = service
+            self._get_drive_service = get_drive_service
+
+        @cached_property
+        def _drive_service(self):
+            """
+            Drive service used to place documents in folders.
+            
+            It is obtained once per handler, so repeated document operations reuse one
+            client and its open connection instead of building a new one per call.
+            """
+            if self._get_drive_service:
+                return self._get_drive_service()
+            return build('drive', 'v3', credentials=self.service._http.credentials)
 
-        def get_document(self, document_id: str):
+        @cached_property
+        def _drive(self) -> "GoogleHelper.DriveHandler":
+            """DriveHandler over _drive_service, for its paginated listing and shared drive options."""
+            return GoogleHelper.DriveHandler(self._drive_service)
+
+        def get_document(self, document_id: str, fields: str = None):
             """
             Get a Google Doc's content.
             
             This method retrieves the full content and metadata of a Google Doc.
             The returned document includes the document's structure, content, and formatting.
+            Pass `fields` to fetch only part of the document, which keeps responses for
+            large documents small.
             
             Args:
                 document_id: ID of the document to retrieve.
+                fields: Optional field mask (e.g., "documentId,title" or "title,body").
+                       If None, the full document is returned.
                 
             Returns:
                 A dictionary containing the document's content and metadata. The structure
-                follows the Google Docs API document resource format.
+                follows the Google Docs API document resource format, limited to `fields`
+                if given.
                 
             Raises:
                 Exception: If the document retrieval fails.
@@ -1087,12 +1704,19 @@ class GoogleHelper:
                 # Access document properties
                 title = document.get('title')
                 content = document.get('body', {}).get('content', [])
+                
+                # Only fetch the title
+                document = google.docs.get_document(
+                    document_id='your_document_id',
+                    fields='title'
+                )
                 ```
             """
             try:
-                return self.service.documents().get(
-                    documentId=document_id
-                ).execute()
+                request_kwargs = {"documentId": document_id}
+                if fields:
+                    request_kwargs["fields"] = fields
+                return self.service.documents().get(**request_kwargs).execute(num_retries=NUM_RETRIES)
             except Exception as e:
                 log.error(f"Error getting document: {str(e)}")
                 raise
@@ -1112,6 +1736,9 @@ class GoogleHelper:
             Returns:
                 A dictionary containing the created document's content and metadata.
                 The structure follows the Google Docs API document resource format.
+                When folder_id is given, the document is created with a single Drive
+                request and only its "documentId" and "title" are returned; use
+                get_document() if you need the full resource.
                 
             Raises:
                 Exception: If the document creation fails.
@@ -1138,9 +1765,7 @@ class GoogleHelper:
                 
                 # If folder_id is provided, we need to use the Drive API to create the document
                 if folder_id:
-                    # We need to access the drive service from the parent GoogleHelper
-                    # This is a bit of a hack, but it works
-                    drive_service = build('drive', 'v3', credentials=self.service._http.credentials)
+                    drive = self._drive
                     
                     doc_metadata = {
                         'name': title,
@@ -1148,13 +1773,15 @@ class GoogleHelper:
                         'parents': [folder_id]
                     }
                     
-                    doc = drive_service.files().create(
+                    doc = drive.service.files().create(
                         body=doc_metadata,
-                        fields='id'
+                        fields='id, name',
+                        **drive._write_options
                     ).execute()
                     
-                    # Now get the document content
-                    return self.get_document(doc.get('id'))
+                    # A new document is empty, so shape the Drive response like the
+                    # Docs resource instead of fetching it again
+                    return {'documentId': doc.get('id'), 'title': doc.get('name', title)}
                 else:
                     # Create document without specifying a folder
                     doc = self.service.documents().create(body=body).execute()
@@ -1201,38 +1828,49 @@ class GoogleHelper:
                 ```
             """
             try:
-                # We need to access the drive service from the parent GoogleHelper
-                # This is a bit of a hack, but it works
-                drive_service = build('drive', 'v3', credentials=self.service._http.credentials)
+                drive = self._drive
+                files = []
                 
                 # Get or create the folder
                 if folder_name and not folder_id:
-                    # Check if the folder exists
-                    folder_query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder'"
-                    folders = drive_service.files().list(q=folder_query).execute().get("files", [])
+                    # Look up the folder and any same-named documents in one request
+                    folder_query = f"name='{folder_name}' and mimeType='{FOLDER_MIME_TYPE}'"
+                    doc_query = f"name='{title}' and mimeType='{DOCUMENT_MIME_TYPE}'"
+                    results = drive._list_all_files(f"({folder_query}) or ({doc_query})")
+                    
+                    folders = [
+                        item for item in results
+                        if item.get("mimeType") == FOLDER_MIME_TYPE and item.get("name") == folder_name
+                    ]
                     
                     if not folders:
                         # Create the folder if it doesn't exist
                         folder_metadata = {
                             "name": folder_name,
-                            "mimeType": "application/vnd.google-apps.folder",
+                            "mimeType": FOLDER_MIME_TYPE,
                         }
-                        folder = drive_service.files().create(
+                        folder = drive.service.files().create(
                             body=folder_metadata, 
-                            fields="id"
+                            fields="id",
+                            **drive._write_options
                         ).execute()
                         folder_id = folder.get("id")
                     else:
                         folder_id = folders[0]["id"]
-                
-                # Check if a document with this name already exists in the folder
-                if folder_id:
-                    file_query = f"name='{title}' and '{folder_id}' in parents and mimeType='application/vnd.google-apps.document'"
-                    files = drive_service.files().list(q=file_query).execute().get("files", [])
-                    
-                    # Delete existing files with the same name
-                    for file in files:
-                        drive_service.files().delete(fileId=file["id"]).execute()
+                        files = [
+                            item for item in results
+                            if item.get("mimeType") == DOCUMENT_MIME_TYPE
+                            and item.get("name") == title
+                            and folder_id in item.get("parents", [])
+                        ]
+                elif folder_id:
+                    # Check if a document with this name already exists in the folder
+                    file_query = f"name='{title}' and '{folder_id}' in parents and mimeType='{DOCUMENT_MIME_TYPE}'"
+                    files = drive._list_all_files(file_query)
+                
+                # Delete existing files with the same name
+                for file in files:
+                    drive.service.files().delete(fileId=file["id"], **drive._write_options).execute(num_retries=NUM_RETRIES)
                 
                 # Create the new document
                 doc_metadata = {
@@ -1243,9 +1881,10 @@ class GoogleHelper:
                 if folder_id:
                     doc_metadata["parents"] = [folder_id]
                 
-                doc = drive_service.files().create(
+                doc = drive.service.files().create(
                     body=doc_metadata, 
-                    fields="id"
+                    fields="id",
+                    **drive._write_options
                 ).execute()
                 
                 return doc.get("id")
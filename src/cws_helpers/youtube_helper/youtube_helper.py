@@ -6,7 +6,8 @@ log = configure_logging(__name__)
 
 # ------------------ Imports ------------------ #
 import pathlib
-from typing import Optional, Any, Dict, List
+from contextlib import contextmanager
+from typing import Optional, Any, Dict, Iterator, List
 from urllib import parse
 import yt_dlp
 from yt_dlp.utils import ExtractorError, DownloadError
@@ -63,7 +64,7 @@ class YoutubeHelper():
         "watch"  # watch paths need either a v parameter or a direct video ID
     }
     
-    def __init__(self, options: Optional[Dict[str, Any]] = None):
+    def __init__(self, options: Optional[Dict[str, Any]] = None, reuse_session: bool = False):
         """
         Initialize the YoutubeHelper with custom options.
         
@@ -74,6 +75,11 @@ class YoutubeHelper():
         Args:
             options (Optional[Dict[str, Any]]): Custom options to pass to yt_dlp.
                                                These will be merged with the default options.
+            reuse_session (bool): If True, a single yt_dlp.YoutubeDL instance is created on
+                                  first use and shared by every lookup, so its open
+                                  connections and cached player JS are reused across URLs.
+                                  Call close() (or use the helper as a context manager)
+                                  when done. Default is False (a fresh instance per call).
         
         Example:
             ```python
@@ -86,6 +92,11 @@ class YoutubeHelper():
                 'writesubtitles': True,
                 'subtitleslangs': ['en', 'es']
             })
+            
+            # Share one yt_dlp session across many lookups
+            with YoutubeHelper(reuse_session=True) as helper:
+                for url in urls:
+                    info = helper.get_video_info(url)
             ```
         """
         # Start with default options
@@ -94,9 +105,52 @@ class YoutubeHelper():
         # Update with any custom options
         if options:
             self.options.update(options)
+        
+        self.reuse_session = reuse_session
+        self._ydl: Optional[yt_dlp.YoutubeDL] = None
             
         log.debug(f"Initialized YoutubeHelper with options: {self.options}")
 
+    def __enter__(self) -> "YoutubeHelper":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the shared yt_dlp session, if one was opened.
+
+        Only relevant when the helper was created with reuse_session=True.
+        It is safe to call this more than once.
+        """
+        if self._ydl is not None:
+            log.debug("Closing shared yt_dlp session")
+            self._ydl.close()
+            self._ydl = None
+
+    @contextmanager
+    def _youtube_dl(self) -> Iterator[yt_dlp.YoutubeDL]:
+        """
+        Provide a yt_dlp.YoutubeDL instance for a single extraction.
+
+        When reuse_session is enabled the same instance is handed out on every call
+        and stays open until close() is called. Otherwise a new instance is created
+        and closed around each call.
+
+        Yields:
+            yt_dlp.YoutubeDL: The instance to extract information with.
+        """
+        if not self.reuse_session:
+            with yt_dlp.YoutubeDL() as ydl:
+                yield ydl
+            return
+
+        if self._ydl is None:
+            log.debug("Opening shared yt_dlp session")
+            self._ydl = yt_dlp.YoutubeDL()
+        yield self._ydl
+
     def is_valid_url(self, url: str) -> bool:
         """
         Validate if a given URL is a valid YouTube URL.
@@ -185,56 +239,10 @@ class YoutubeHelper():
         # options = download_options if download_options is not None else self.options   
         
         try:
-            with yt_dlp.YoutubeDL() as ydl:
+            with self._youtube_dl() as ydl:
                 try:
                     result = ydl.extract_info(url, download=False)
-                    if not result:
-                        raise YouTubeVideoUnavailable("No video information returned")
-                    
-                    # Extract the video info
-                    video_info = self._extract_video_info(result)
-                    
-                    try:
-                        # Process automatic captions and subtitles for model validation
-                        auto_captions = video_info.get("automatic_captions", {})
-                        subtitles = video_info.get("subtitles", {})
-                        
-                        # Validate the caption models first
-                        validated_auto_captions = YTDLPAutomaticCaption.model_validate(auto_captions)
-                        validated_subtitles = YTDLPSubtitle.model_validate(subtitles)
-                        
-                        # Update the video info with validated caption models
-                        video_info["automatic_captions"] = validated_auto_captions
-                        video_info["subtitles"] = validated_subtitles
-                        
-                        # Now validate the full video details
-                        return YTDLPVideoDetails.model_validate(video_info)
-                    except Exception as validation_error:
-                        # Log the validation error with more details for debugging
-                        log.warning(f"Validation error for video {url}: {str(validation_error)}")
-                        
-                        # Create a simplified version of the video info with only essential fields
-                        # This is more maintainable than the previous approach
-                        simplified_info = {
-                            "id": video_info.get("youtube_id", "unknown_id"),
-                            "title": video_info.get("title", "Unknown Title"),
-                            # Empty collections to avoid validation errors
-                            "formats": [],
-                            "thumbnails": [],
-                            # Add automatic captions and subtitles as empty objects
-                            "automatic_captions": YTDLPAutomaticCaption.model_validate({"root": {}}),
-                            "subtitles": YTDLPSubtitle.model_validate({"root": {}}),
-                        }
-                        
-                        # Copy over any fields that exist in video_info with default values for missing fields
-                        # This is more maintainable than listing every field explicitly
-                        for field_name in YTDLPVideoDetails.__annotations__:
-                            if field_name not in simplified_info and field_name in video_info:
-                                simplified_info[field_name] = video_info[field_name]
-                        
-                        # Try to validate the simplified info
-                        return YTDLPVideoDetails.model_validate(simplified_info)
-                        
+                    return self.get_video_info_from_dict(result)
                 except yt_dlp.utils.DownloadError as e:
                     error_message = str(e)
                     if "Video unavailable" in error_message:
@@ -259,6 +267,70 @@ class YoutubeHelper():
             log.error(f"Error getting video info for {url}: {str(e)}")
             raise YouTubeVideoUnavailable(f"Unknown error: {str(e)}")
 
+    def get_video_info_from_dict(self, result: Optional[Dict[str, Any]]) -> YTDLPVideoDetails:
+        """
+        Build video details from an info dictionary that was already extracted by yt-dlp.
+
+        Use this when you already called yt_dlp.YoutubeDL.extract_info yourself, to avoid
+        fetching the same video a second time through get_video_info.
+
+        Args:
+            result (Optional[Dict[str, Any]]): The raw result dictionary from yt-dlp.
+
+        Returns:
+            YTDLPVideoDetails: A model containing detailed information about the video.
+
+        Raises:
+            YouTubeVideoUnavailable: If no video information was provided.
+        """
+        log.debug("get_video_info_from_dict")
+        if not result:
+            raise YouTubeVideoUnavailable("No video information returned")
+        
+        # Extract the video info
+        video_info = self._extract_video_info(result)
+        
+        try:
+            # Process automatic captions and subtitles for model validation
+            auto_captions = video_info.get("automatic_captions", {})
+            subtitles = video_info.get("subtitles", {})
+            
+            # Validate the caption models first
+            validated_auto_captions = YTDLPAutomaticCaption.model_validate(auto_captions)
+            validated_subtitles = YTDLPSubtitle.model_validate(subtitles)
+            
+            # Update the video info with validated caption models
+            video_info["automatic_captions"] = validated_auto_captions
+            video_info["subtitles"] = validated_subtitles
+            
+            # Now validate the full video details
+            return YTDLPVideoDetails.model_validate(video_info)
+        except Exception as validation_error:
+            # Log the validation error with more details for debugging
+            log.warning(f"Validation error for video {video_info.get('id')}: {str(validation_error)}")
+            
+            # Create a simplified version of the video info with only essential fields
+            # This is more maintainable than the previous approach
+            simplified_info = {
+                "id": video_info.get("youtube_id", "unknown_id"),
+                "title": video_info.get("title", "Unknown Title"),
+                # Empty collections to avoid validation errors
+                "formats": [],
+                "thumbnails": [],
+                # Add automatic captions and subtitles as empty objects
+                "automatic_captions": YTDLPAutomaticCaption.model_validate({"root": {}}),
+                "subtitles": YTDLPSubtitle.model_validate({"root": {}}),
+            }
+            
+            # Copy over any fields that exist in video_info with default values for missing fields
+            # This is more maintainable than listing every field explicitly
+            for field_name in YTDLPVideoDetails.__annotations__:
+                if field_name not in simplified_info and field_name in video_info:
+                    simplified_info[field_name] = video_info[field_name]
+            
+            # Try to validate the simplified info
+            return YTDLPVideoDetails.model_validate(simplified_info)
+
     def _extract_video_info(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract relevant information from the yt-dlp result.
@@ -594,44 +666,11 @@ class YoutubeHelper():
                 'skip_download': True,
             })
             
-            with yt_dlp.YoutubeDL() as ydl:
+            with self._youtube_dl() as ydl:
                 try:
                     # Extract info without downloading
                     result = ydl.extract_info(url, download=False)
-                    if not result:
-                        log.warning(f"No video information returned for {url}")
-                        return {}
-                    
-                    # Get all captions using _extract_captions
-                    all_captions = self._extract_captions(result)
-                    
-                    # If we only want preferred captions, filter the results
-                    if not return_all_captions:
-                        # Define preferred languages
-                        preferred_languages = ["en-orig", "en", "auto-en", "auto-en-orig"]
-                        
-                        # Filter to only include preferred languages
-                        preferred_captions = {
-                            lang: captions for lang, captions in all_captions.items()
-                            if lang in preferred_languages
-                        }
-                        
-                        # Log the result for debugging
-                        if preferred_captions:
-                            log.debug(f"Found preferred captions for video {url}: {preferred_captions}")
-                        else:
-                            log.debug(f"No preferred captions found for video {url}")
-                        
-                        return preferred_captions
-                    
-                    # Return all captions
-                    if all_captions:
-                        log.debug(f"Found all captions for video {url}: {all_captions}")
-                    else:
-                        log.debug(f"No captions found for video {url}")
-                    
-                    return all_captions
-                    
+                    return self.list_captions_from_dict(result, return_all_captions)
                 except yt_dlp.utils.DownloadError as e:
                     error_message = str(e)
                     log.warning(f"Download error for video {url}: {error_message}")
@@ -644,3 +683,55 @@ class YoutubeHelper():
         except Exception as e:
             log.warning(f"Error listing captions for video {url}: {str(e)}")
             return {}
+
+    def list_captions_from_dict(self, result: Optional[Dict[str, Any]], return_all_captions: bool = False) -> Dict[str, List[YTDLPCaption]]:
+        """
+        List available captions from an info dictionary that was already extracted by yt-dlp.
+
+        This is the offline counterpart of list_available_captions: it applies the same
+        preferred-language filtering without fetching the video again.
+
+        Args:
+            result (Optional[Dict[str, Any]]): The raw result dictionary from yt-dlp.
+            return_all_captions (bool): If True, returns all available captions instead of just preferred ones.
+                                       Default is False (only preferred captions).
+
+        Returns:
+            Dict[str, List[YTDLPCaption]]: A dictionary mapping language codes to lists of available caption objects.
+        """
+        log.debug("list_captions_from_dict")
+        if not result:
+            log.warning("No video information returned")
+            return {}
+        
+        video_id = result.get("id")
+        
+        # Get all captions using _extract_captions
+        all_captions = self._extract_captions(result)
+        
+        # If we only want preferred captions, filter the results
+        if not return_all_captions:
+            # Define preferred languages
+            preferred_languages = ["en-orig", "en", "auto-en", "auto-en-orig"]
+            
+            # Filter to only include preferred languages
+            preferred_captions = {
+                lang: captions for lang, captions in all_captions.items()
+                if lang in preferred_languages
+            }
+            
+            # Log the result for debugging
+            if preferred_captions:
+                log.debug(f"Found preferred captions for video {video_id}: {preferred_captions}")
+            else:
+                log.debug(f"No preferred captions found for video {video_id}")
+            
+            return preferred_captions
+        
+        # Return all captions
+        if all_captions:
+            log.debug(f"Found all captions for video {video_id}: {all_captions}")
+        else:
+            log.debug(f"No captions found for video {video_id}")
+        
+        return all_captions
@@ -3,12 +3,113 @@
 Test script for the YouTube helper.
 This script tests the YouTube helper with specific URLs to verify caption retrieval functionality.
 It limits caption output to avoid overwhelming the chat.
+
+The per-language caption samples are only built when DEBUG logging is enabled
+(run with LOG_LEVEL=10 to see them).
 """
 
+from src.cws_helpers.logger import configure_logging
 from src.cws_helpers.youtube_helper.youtube_helper import YoutubeHelper, yt_dlp
 from src.cws_helpers.youtube_helper.enums.youtube_helper_enums import CaptionExtension
 import json
+import logging
 import pprint
+import reprlib
+from itertools import islice
+
+log = configure_logging(__name__)
+
+# Caption dictionaries with more languages than this are reported by count only
+MAX_LISTED_LANGUAGES = 10
+
+# Bounded repr that truncates while serializing instead of after str() builds the whole thing
+_trunc = reprlib.Repr()
+_trunc.maxstring = 200
+_trunc.maxother = 200
+_trunc.maxdict = 5
+_trunc.maxlist = 5
+
+def _describe_languages(caption_dict, limit_langs):
+    """Describe the available languages without listing hundreds of auto-caption codes."""
+    if len(caption_dict) > MAX_LISTED_LANGUAGES:
+        return f"Available languages: {len(caption_dict)} languages (showing {limit_langs})"
+    return f"Available languages: {list(caption_dict)}"
+
+def _summarize_captions(caption_dict, caption_type="captions", limit_langs=2, limit_fmts=3):
+    """
+    Build a limited summary of raw captions to avoid overwhelming output.
+    
+    The caption dictionary is walked once and the summary is returned as a single
+    string so the caller can print it in one go.
+    
+    Args:
+        caption_dict: Dictionary containing caption data
+        caption_type: String describing the type of captions
+        limit_langs: Maximum number of languages to show details for
+        limit_fmts: Maximum number of formats to show per language
+    
+    Returns:
+        str: The formatted summary
+    """
+    if not caption_dict:
+        return f"No {caption_type} available"
+    
+    lines = [f"\nRaw {caption_type}:", f"Type: {type(caption_dict)}"]
+    
+    if not isinstance(caption_dict, dict):
+        lines.append(f"  Content: {_trunc.repr(caption_dict)}")
+        return "\n".join(lines)
+    
+    lines.append(_describe_languages(caption_dict, limit_langs))
+    
+    for lang, formats in islice(caption_dict.items(), limit_langs):
+        lines.append(f"\nSample for language '{lang}':")
+        
+        if not (isinstance(formats, list) and formats):
+            lines.append(f"  Formats: {_trunc.repr(formats)}")
+            continue
+        
+        sample_formats = formats[:limit_fmts]
+        lines.append(f"Showing {len(sample_formats)} of {len(formats)} formats:")
+        for i, fmt in enumerate(sample_formats):
+            lines.append(f"  Format {i+1}:")
+            # For each format, show only key information
+            if isinstance(fmt, dict):
+                lines.extend(f"    {key}: {fmt[key]}" for key in ('ext', 'url', 'name') if key in fmt)
+            else:
+                lines.append(f"    {_trunc.repr(fmt)}")
+    
+    return "\n".join(lines)
+
+def _summarize_processed_captions(caption_obj, caption_type="captions", limit_langs=2, limit_fmts=2):
+    """
+    Build a limited summary of processed caption models.
+    
+    The models already guarantee a dict of language code to list of captions, so
+    the root is read once and only the sampled languages are visited.
+    
+    Args:
+        caption_obj: A processed caption model with a ``root`` mapping
+        caption_type: String describing the type of captions
+        limit_langs: Maximum number of languages to show details for
+        limit_fmts: Maximum number of formats to show per language
+    
+    Returns:
+        str: The formatted summary
+    """
+    root = getattr(caption_obj, 'root', None)
+    if not root:
+        return f"No {caption_type} in processed info"
+    
+    lines = [f"Processed {caption_type}:", f"Root type: {type(root)}", _describe_languages(root, limit_langs)]
+    
+    for lang, formats in islice(root.items(), limit_langs):
+        sample_formats = formats[:limit_fmts]
+        lines.append(f"\nSample for language '{lang}':")
+        lines.append(f"Showing {len(sample_formats)} format(s)")
+        lines.extend(f"  Format {i+1}: {_trunc.repr(fmt)}" for i, fmt in enumerate(sample_formats))
+    
+    return "\n".join(lines)
 
 def test_youtube_helper():
     """Test the YouTube helper with specific URLs."""
@@ -22,171 +123,89 @@ def test_youtube_helper():
         "https://youtu.be/i2WIbFfH5cs?si=zmcLXc1F2QyNDZsB",  # Big Buck Bunny (known to have captions)
     ]
     
-    for url in urls:
-        print(f"\n\n{'='*50}")
-        print(f"=== Testing URL: {url} ===")
-        print(f"{'='*50}\n")
-        
-        # Test if the URL is valid
-        print(f"URL valid: {helper.is_valid_url(url)}")
+    # Build the subtitle-enabled options once for every URL
+    options_with_subs = {
+        **helper.options,
+        'writesubtitles': True,
+        'write_auto_subs': True,
+        'subtitleslangs': ['en'],
+        'skip_download': True,
+    }
+    
+    # Skip walking the caption dictionaries entirely unless their output will be shown
+    show_caption_details = log.isEnabledFor(logging.DEBUG)
+    
+    # Open a single subtitle-enabled YoutubeDL so its connections and player JS are
+    # reused across URLs; the helper only parses what it returns
+    with yt_dlp.YoutubeDL(options_with_subs) as ydl:
+        for url in urls:
+            # Collect this URL's output and print it in one write at the end
+            out = []
+            out.append(f"\n\n{'='*50}")
+            out.append(f"=== Testing URL: {url} ===")
+            out.append(f"{'='*50}\n")
         
-        # Get raw video info directly from yt-dlp with write_auto_subs and writesubtitles enabled
-        print("\nGetting raw video info from yt-dlp with captions enabled...")
+            # Test if the URL is valid
+            out.append(f"URL valid: {helper.is_valid_url(url)}")
         
-        # Create a copy of options with subtitles enabled
-        options_with_subs = helper.options.copy()
-        options_with_subs.update({
-            'writesubtitles': True,
-            'write_auto_subs': True,
-            'subtitleslangs': ['en'],
-            'skip_download': True,
-        })
+            # Get raw video info directly from yt-dlp with write_auto_subs and writesubtitles enabled
+            out.append("\nGetting raw video info from yt-dlp with captions enabled...")
         
-        with yt_dlp.YoutubeDL(options_with_subs) as ydl:
+            raw_info = None
             try:
                 raw_info = ydl.extract_info(url, download=False)
                 
                 # Check for captions in raw info
-                print("\nChecking for captions in raw info:")
+                out.append("\nChecking for captions in raw info:")
                 
                 # Debug the entire raw_info structure
-                print("\nRaw info keys available:")
-                print(list(raw_info.keys()))
-                
-                # Function to limit and format caption output
-                def print_limited_captions(caption_dict, caption_type="captions"):
-                    """
-                    Print a limited sample of captions to avoid overwhelming output.
-                    
-                    Args:
-                        caption_dict: Dictionary containing caption data
-                        caption_type: String describing the type of captions
-                    """
-                    if not caption_dict:
-                        print(f"No {caption_type} available")
-                        return
-                        
-                    print(f"\nRaw {caption_type}:")
-                    print(f"Type: {type(caption_dict)}")
-                    
-                    if isinstance(caption_dict, dict):
-                        langs = list(caption_dict.keys())
-                        print(f"Available languages: {langs}")
-                        
-                        # Show details for at most 2 languages
-                        sample_langs = langs[:2]
-                        for lang in sample_langs:
-                            print(f"\nSample for language '{lang}':")
-                            formats = caption_dict[lang]
-                            
-                            # Show at most 3 caption formats per language
-                            if isinstance(formats, list) and formats:
-                                sample_formats = formats[:3]
-                                print(f"Showing {len(sample_formats)} of {len(formats)} formats:")
-                                for i, fmt in enumerate(sample_formats):
-                                    print(f"  Format {i+1}:")
-                                    # For each format, show only key information
-                                    if isinstance(fmt, dict):
-                                        keys_to_show = ['ext', 'url', 'name'] 
-                                        for key in keys_to_show:
-                                            if key in fmt:
-                                                print(f"    {key}: {fmt[key]}")
-                                    else:
-                                        print(f"    {fmt}")
-                            else:
-                                print(f"  Formats: {formats}")
-                    else:
-                        print(f"  Content: {str(caption_dict)[:200]}...")
+                out.append("\nRaw info keys available:")
+                out.append(str(list(raw_info.keys())))
                 
-                # Print limited caption information
-                if 'automatic_captions' in raw_info:
-                    print_limited_captions(raw_info['automatic_captions'], "automatic_captions")
-                else:
-                    print("No automatic_captions field in raw info")
-                    
-                if 'subtitles' in raw_info:
-                    print_limited_captions(raw_info['subtitles'], "subtitles")
-                else:
-                    print("No subtitles field in raw info")
+                # Summarize each caption dictionary in a single pass
+                if show_caption_details:
+                    out.append(_summarize_captions(raw_info.get('automatic_captions'), "automatic_captions"))
+                    out.append(_summarize_captions(raw_info.get('subtitles'), "subtitles"))
             except Exception as e:
-                print(f"Error extracting raw info: {str(e)}")
+                out.append(f"Error extracting raw info: {str(e)}")
         
-        # Test getting video information
-        print("\nTesting get_video_info...")
-        try:
-            video_info = helper.get_video_info(url)
-            print(f"Success! Video title: {video_info.title}")
-            
-            # Examine the captions in the processed video info (limited output)
-            print("\nExamining captions in processed video info:")
+            # Test getting video information from the raw info we already extracted
+            out.append("\nTesting get_video_info_from_dict...")
+            try:
+                video_info = helper.get_video_info_from_dict(raw_info)
+                out.append(f"Success! Video title: {video_info.title}")
             
-            # Helper function to print limited processed caption info
-            def print_limited_processed_captions(caption_obj, caption_type="captions"):
-                """Print limited information about processed captions."""
-                if not caption_obj:
-                    print(f"No {caption_type} in processed info")
-                    return
-                    
-                print(f"Processed {caption_type}:")
-                if hasattr(caption_obj, 'root') and caption_obj.root:
-                    root = caption_obj.root
-                    print(f"Root type: {type(root)}")
-                    
-                    if isinstance(root, dict):
-                        langs = list(root.keys())
-                        print(f"Available languages: {langs}")
-                        
-                        # Show at most 2 languages
-                        sample_langs = langs[:2]
-                        for lang in sample_langs:
-                            print(f"\nSample for language '{lang}':")
-                            # Show limited information about this language's captions
-                            if isinstance(root[lang], list):
-                                formats = root[lang][:2]  # Show at most 2 formats
-                                print(f"Showing {len(formats)} format(s)")
-                                for i, fmt in enumerate(formats):
-                                    print(f"  Format {i+1}: {str(fmt)[:100]}...")
-                            else:
-                                print(f"  Content: {str(root[lang])[:100]}...")
-                    else:
-                        print(f"  Root content: {str(root)[:200]}...")
+                # Examine the captions in the processed video info (limited output)
+                if show_caption_details:
+                    out.append("\nExamining captions in processed video info:")
+                    out.append(_summarize_processed_captions(video_info.automatic_captions, "automatic_captions"))
+                    out.append(_summarize_processed_captions(video_info.subtitles, "subtitles"))
+            except Exception as e:
+                out.append(f"Error getting video info: {str(e)}")
+        
+            # Test listing available captions from the same raw info
+            out.append("\nTesting list_captions_from_dict...")
+            try:
+                captions = helper.list_captions_from_dict(raw_info)
+                if captions:
+                    out.append("Available captions:")
+                    # Limit to showing only 3 languages
+                    lang_count = 0
+                    for lang, formats in captions.items():
+                        format_names = [f.name if hasattr(f, 'name') else str(f) for f in formats]
+                        out.append(f"  {lang}: {', '.join(format_names[:3])}{'...' if len(format_names) > 3 else ''}")
+                        lang_count += 1
+                        if lang_count >= 3:
+                            remaining = len(captions) - 3
+                            if remaining > 0:
+                                out.append(f"  ... and {remaining} more language(s)")
+                            break
                 else:
-                    print(f"No 'root' attribute in {caption_type}")
+                    out.append("No captions available for this video.")
+            except Exception as e:
+                out.append(f"Error listing captions: {str(e)}")
             
-            # Print limited processed caption information
-            if hasattr(video_info, 'automatic_captions') and video_info.automatic_captions:
-                print_limited_processed_captions(video_info.automatic_captions, "automatic_captions")
-            else:
-                print("No automatic_captions in processed info")
-                
-            if hasattr(video_info, 'subtitles') and video_info.subtitles:
-                print_limited_processed_captions(video_info.subtitles, "subtitles")
-            else:
-                print("No subtitles in processed info")
-        except Exception as e:
-            print(f"Error getting video info: {str(e)}")
-        
-        # Test listing available captions
-        print("\nTesting list_available_captions...")
-        try:
-            captions = helper.list_available_captions(url)
-            if captions:
-                print("Available captions:")
-                # Limit to showing only 3 languages
-                lang_count = 0
-                for lang, formats in captions.items():
-                    format_names = [f.name if hasattr(f, 'name') else str(f) for f in formats]
-                    print(f"  {lang}: {', '.join(format_names[:3])}{'...' if len(format_names) > 3 else ''}")
-                    lang_count += 1
-                    if lang_count >= 3:
-                        remaining = len(captions) - 3
-                        if remaining > 0:
-                            print(f"  ... and {remaining} more language(s)")
-                        break
-            else:
-                print("No captions available for this video.")
-        except Exception as e:
-            print(f"Error listing captions: {str(e)}")
+            print("\n".join(out))
 
 if __name__ == "__main__":
     test_youtube_helper() 
\ No newline at end of file
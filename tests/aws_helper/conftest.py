@@ -0,0 +1,23 @@
+"""
+Fixtures shared by the AWS helper tests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+@pytest.fixture
+def bulk_put():
+    """
+    Upload several objects through an S3Helper concurrently.
+    
+    Returns a function ``bulk_put(helper, keys, content)`` that issues the
+    ``put_object`` calls from a small thread pool instead of one after another.
+    """
+    def _bulk_put(helper, keys, content):
+        keys = list(keys)
+        if not keys:
+            return
+        with ThreadPoolExecutor(max_workers=min(16, len(keys))) as executor:
+            list(executor.map(lambda key: helper.put_object(key, content), keys))
+    return _bulk_put
@@ -20,97 +20,30 @@ class TestAWSErrors:
     This class contains tests for all the custom AWS error classes.
     """
     
-    def test_aws_error_base_class(self):
+    @pytest.mark.parametrize("error_class,parent_classes", [
+        (AWSError, [Exception]),
+        (AWSConfigError, [AWSError, Exception]),
+        (S3Error, [AWSError, Exception]),
+        (S3UploadError, [S3Error, AWSError, Exception]),
+        (S3DownloadError, [S3Error, AWSError, Exception]),
+    ])
+    def test_error_hierarchy(self, error_class, parent_classes):
         """
-        Test the base AWSError class.
+        Test each AWS error class and its place in the inheritance chain.
         
         This test verifies that:
         1. The error message is stored correctly
         2. The error can be converted to a string
-        3. The error inherits from Exception
+        3. The error inherits from every class above it:
+           Exception -> AWSError -> AWSConfigError/S3Error -> S3UploadError/S3DownloadError
         """
         error_message = "Test AWS error"
-        error = AWSError(error_message)
+        error = error_class(error_message)
         
         assert error.message == error_message
         assert str(error) == error_message
-        assert isinstance(error, Exception)
-    
-    def test_aws_config_error(self):
-        """
-        Test the AWSConfigError class.
-        
-        This test verifies that:
-        1. The error message is stored correctly
-        2. The error inherits from AWSError
-        """
-        error_message = "AWS credentials not found"
-        error = AWSConfigError(error_message)
-        
-        assert error.message == error_message
-        assert isinstance(error, AWSError)
-    
-    def test_s3_error_base_class(self):
-        """
-        Test the base S3Error class.
-        
-        This test verifies that:
-        1. The error message is stored correctly
-        2. The error inherits from AWSError
-        """
-        error_message = "Test S3 error"
-        error = S3Error(error_message)
-        
-        assert error.message == error_message
-        assert isinstance(error, AWSError)
-    
-    def test_s3_upload_error(self):
-        """
-        Test the S3UploadError class.
-        
-        This test verifies that:
-        1. The error message is stored correctly
-        2. The error inherits from S3Error
-        """
-        error_message = "Failed to upload object"
-        error = S3UploadError(error_message)
-        
-        assert error.message == error_message
-        assert isinstance(error, S3Error)
-    
-    def test_s3_download_error(self):
-        """
-        Test the S3DownloadError class.
-        
-        This test verifies that:
-        1. The error message is stored correctly
-        2. The error inherits from S3Error
-        """
-        error_message = "Failed to download object"
-        error = S3DownloadError(error_message)
-        
-        assert error.message == error_message
-        assert isinstance(error, S3Error)
-    
-    def test_error_inheritance_chain(self):
-        """
-        Test the error inheritance chain.
-        
-        This test verifies that the error inheritance chain is correct:
-        Exception -> AWSError -> S3Error -> S3UploadError/S3DownloadError
-        """
-        upload_error = S3UploadError("Upload error")
-        download_error = S3DownloadError("Download error")
-        
-        # Test S3UploadError inheritance
-        assert isinstance(upload_error, S3Error)
-        assert isinstance(upload_error, AWSError)
-        assert isinstance(upload_error, Exception)
-        
-        # Test S3DownloadError inheritance
-        assert isinstance(download_error, S3Error)
-        assert isinstance(download_error, AWSError)
-        assert isinstance(download_error, Exception)
+        for parent_class in parent_classes:
+            assert isinstance(error, parent_class)
     
     def test_error_catching(self):
         """
@@ -119,29 +52,9 @@ class TestAWSErrors:
         This test verifies that errors can be caught at any level of the
         inheritance chain.
         """
-        # Create an error
         error = S3UploadError("Test error")
         
-        # Test catching as S3UploadError
-        try:
-            raise error
-        except S3UploadError as e:
-            assert e is error
-        
-        # Test catching as S3Error
-        try:
-            raise error
-        except S3Error as e:
-            assert e is error
-        
-        # Test catching as AWSError
-        try:
-            raise error
-        except AWSError as e:
-            assert e is error
-        
-        # Test catching as Exception
-        try:
-            raise error
-        except Exception as e:
-            assert e is error 
\ No newline at end of file
+        for error_class in (S3UploadError, S3Error, AWSError, Exception):
+            with pytest.raises(error_class) as excinfo:
+                raise error
+            assert excinfo.value is error
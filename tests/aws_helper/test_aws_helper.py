@@ -10,11 +10,10 @@ Note: These tests require the following packages:
     - boto3
 """
 
-import os
 import json
+from io import BytesIO
 import pytest
-from unittest.mock import patch, MagicMock
-import boto3
+from unittest.mock import patch, Mock
 from botocore.exceptions import ClientError
 from moto import mock_aws
 from cws_helpers.aws_helper import S3Helper
@@ -28,54 +27,148 @@ TEST_JSON_KEY = "test/data.json"
 TEST_CONTENT = b"Test content"
 TEST_JSON_DATA = {"key": "value", "nested": {"data": 123}}
 
-@pytest.fixture(scope="function")
-def aws_credentials():
+# Non-404/NoSuchKey client errors shared by the error-path tests
+ACCESS_DENIED_RESPONSE = {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}
+GET_ACCESS_DENIED = ClientError(ACCESS_DENIED_RESPONSE, 'GetObject')
+HEAD_ACCESS_DENIED = ClientError(ACCESS_DENIED_RESPONSE, 'HeadObject')
+
+# Keys served in pages of PAGE_SIZE by the paged_list_objects fixture
+PAGED_KEYS = [f"test/max_keys/file{i}.txt" for i in range(5)]
+PAGE_SIZE = 3
+
+# Keep these tests on one pytest-xdist worker so the module-scoped moto
+# mock and bucket are only built once when running with --dist loadgroup
+pytestmark = pytest.mark.xdist_group("s3_shared_bucket")
+
+@pytest.fixture(scope="module")
+def aws_mock():
     """
-    Mocked AWS Credentials for moto.
+    Moto mock shared by every test in this module.
     
-    This fixture sets up mock AWS credentials for testing purposes.
+    Starting moto once avoids re-patching botocore for each test. Don't
+    replace this with ``@mock_aws`` on the test class: moto's class
+    decorator starts, resets and stops the mock around every test method,
+    which would wipe the module-scoped bucket between tests.
     """
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = TEST_REGION
+    with mock_aws() as mock:
+        yield mock
 
-@pytest.fixture(scope="function")
-def s3_client(aws_credentials):
+@pytest.fixture(scope="module")
+def s3_client(aws_mock, boto_session):
     """
     Mocked S3 client.
     
-    This fixture creates a mocked S3 client and test bucket.
+    This fixture creates a mocked S3 client from the shared boto3 session
+    and the test bucket once per module.
     """
-    with mock_aws():
-        s3_client = boto3.client("s3", region_name=TEST_REGION)
-        s3_client.create_bucket(Bucket=TEST_BUCKET)
-        yield s3_client
+    s3_client = boto_session.client("s3")
+    s3_client.create_bucket(Bucket=TEST_BUCKET)
+    return s3_client
 
-@pytest.fixture(scope="function")
-def s3_helper(aws_credentials):
+@pytest.fixture(scope="module")
+def s3_helper(s3_client):
     """
     S3Helper instance for testing.
     
-    This fixture creates an S3Helper instance with mock credentials.
+    This fixture reuses the bucket created by ``s3_client`` and builds the
+    helper once per module; ``empty_bucket`` removes any objects a test
+    leaves behind.
     """
-    with mock_aws():
-        # Create the bucket first
-        s3_client = boto3.client(
-            "s3", 
-            region_name=TEST_REGION,
-            aws_access_key_id=os.environ["AWS_ACCESS_KEY_ID"],
-            aws_secret_access_key=os.environ["AWS_SECRET_ACCESS_KEY"]
-        )
-        s3_client.create_bucket(Bucket=TEST_BUCKET)
-        
-        # Create and return the helper
-        helper = S3Helper(
+    return S3Helper(
+        bucket_name=TEST_BUCKET,
+        region_name=TEST_REGION
+    )
+
+@pytest.fixture(autouse=True)
+def empty_bucket(request):
+    """
+    Delete every object in the test bucket after each test that used it.
+    
+    The bucket is created once by ``s3_client`` and never recreated; only its
+    keys are removed, in batched delete_objects calls (up to 1000 per page).
+    Tests that don't request ``s3_helper`` skip the cleanup entirely.
+    """
+    yield
+    if "s3_helper" not in request.fixturenames:
+        return
+    client = request.getfixturevalue("s3_helper").s3_client
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=TEST_BUCKET):
+        objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+        if objects:
+            client.delete_objects(
+                Bucket=TEST_BUCKET,
+                Delete={"Objects": objects, "Quiet": True}
+            )
+
+@pytest.fixture(scope="function")
+def in_memory_s3(monkeypatch, s3_helper):
+    """
+    Replace the helper's S3 client with a dict-backed stand-in.
+    
+    For tests that only exercise how S3Helper encodes and decodes bodies,
+    this skips the moto request path entirely. The original client is
+    restored when the test finishes.
+    
+    Returns:
+        Dict[str, bytes]: The store, keyed by object key
+    """
+    store = {}
+    
+    def put_object(**kwargs):
+        body = kwargs['Body']
+        store[kwargs['Key']] = body.encode('utf-8') if isinstance(body, str) else body
+    
+    def get_object(**kwargs):
+        return {'Body': BytesIO(store[kwargs['Key']])}
+    
+    client = Mock(spec=["put_object", "get_object"])
+    client.put_object.side_effect = put_object
+    client.get_object.side_effect = get_object
+    monkeypatch.setattr(s3_helper, "s3_client", client)
+    return store
+
+@pytest.fixture(scope="function")
+def mock_s3_helper():
+    """
+    S3Helper whose boto3 client is a mock.
+    
+    For tests of the helper's own logic (such as list_objects pagination)
+    that don't need moto or a real bucket. The client is spec'd to the
+    methods those tests use, so any other S3 call fails loudly.
+    """
+    client = Mock(spec=["list_objects_v2"])
+    with patch("cws_helpers.aws_helper.aws_helper.boto3.client", return_value=client):
+        yield S3Helper(
             bucket_name=TEST_BUCKET,
             region_name=TEST_REGION
         )
-        yield helper
+
+@pytest.fixture(scope="function")
+def paged_list_objects(mock_s3_helper):
+    """
+    Serve PAGED_KEYS from the mocked client's list_objects_v2.
+    
+    Like S3, it honours MaxKeys and returns at most PAGE_SIZE keys per page,
+    so tests can check when list_objects stops requesting more.
+    
+    Returns:
+        Mock: The list_objects_v2 mock, for inspecting calls
+    """
+    def list_objects_v2(**kwargs):
+        start = int(kwargs.get('ContinuationToken', 0))
+        end = min(start + PAGE_SIZE, start + kwargs.get('MaxKeys', 1000), len(PAGED_KEYS))
+        response = {
+            'Contents': [{'Key': key} for key in PAGED_KEYS[start:end]],
+            'IsTruncated': end < len(PAGED_KEYS)
+        }
+        if response['IsTruncated']:
+            response['NextContinuationToken'] = str(end)
+        return response
+    
+    list_objects = mock_s3_helper.s3_client.list_objects_v2
+    list_objects.side_effect = list_objects_v2
+    return list_objects
 
 class TestS3Helper:
     """
@@ -97,13 +190,13 @@ class TestS3Helper:
         assert helper.bucket_name == TEST_BUCKET
         assert helper.region_name == TEST_REGION
         
-    def test_init_missing_credentials(self):
+    def test_init_missing_credentials(self, monkeypatch):
         """
         Test initialization with missing credentials.
         """
-        # Clear environment variables
-        os.environ.pop("AWS_ACCESS_KEY_ID", None)
-        os.environ.pop("AWS_SECRET_ACCESS_KEY", None)
+        # Clear environment variables for this test only
+        monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+        monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
         
         with pytest.raises(AWSConfigError) as exc_info:
             S3Helper(bucket_name=TEST_BUCKET)
@@ -157,30 +250,28 @@ class TestS3Helper:
         # Now it should exist
         assert s3_helper.object_exists(TEST_KEY)
     
-    def test_list_objects(self, s3_helper):
+    def test_list_objects(self, s3_helper, bulk_put):
         """
         Test listing objects with a prefix.
         """
-        # Create multiple objects with different prefixes
+        # Create multiple objects with different prefixes, including one
+        # outside the listed prefix
         prefix = "test/list/"
         keys = [f"{prefix}file{i}.txt" for i in range(5)]
         
-        for key in keys:
-            s3_helper.put_object(key, TEST_CONTENT)
-        
-        # Also create an object with a different prefix
-        s3_helper.put_object("other/file.txt", TEST_CONTENT)
+        bulk_put(s3_helper, keys + ["other/file.txt"], TEST_CONTENT)
         
         # List objects with the prefix
         result = s3_helper.list_objects(prefix=prefix)
         
-        # Verify all expected keys are returned
-        assert sorted(result) == sorted(keys)
+        # Verify all expected keys are returned, without duplicates
+        assert len(result) == len(keys)
+        assert set(result) == set(keys)
         
         # Test with max_keys
         result_limited = s3_helper.list_objects(prefix=prefix, max_keys=2)
         assert len(result_limited) == 2
-        assert all(key in keys for key in result_limited)
+        assert set(result_limited) <= set(keys)
     
     def test_delete_object(self, s3_helper):
         """
@@ -219,7 +310,7 @@ class TestS3Helper:
         
         assert "Failed to parse JSON" in str(exc_info.value)
         
-    def test_put_object_with_string(self, s3_helper):
+    def test_put_object_with_string(self, s3_helper, in_memory_s3):
         """
         Test putting a string object.
         
@@ -249,75 +340,46 @@ class TestS3Helper:
         response = s3_client.head_object(Bucket=TEST_BUCKET, Key=TEST_KEY)
         assert response.get('ContentType') == content_type
         
-    def test_list_objects_pagination(self, s3_helper):
+    def test_list_objects_pagination(self, mock_s3_helper):
         """
         Test pagination in list_objects.
         
         This test verifies that pagination works correctly when there are
-        more objects than can be returned in a single response.
+        more objects than can be returned in a single response. The listing
+        is served by a plain mock, so no objects are created.
         """
-        # Create many objects (more than default pagination limit)
         prefix = "test/pagination/"
         keys = [f"{prefix}file{i}.txt" for i in range(1005)]  # More than 1000 (default limit)
-        
-        # Mock the pagination by patching the list_objects_v2 method
-        # Since creating 1005 objects is slow, we'll simulate pagination
-        original_list_objects = s3_helper.s3_client.list_objects_v2
-        
-        def mock_list_objects_v2(**kwargs):
-            """Mock implementation that simulates pagination."""
-            prefix = kwargs.get('Prefix', '')
-            max_keys = kwargs.get('MaxKeys', 1000)
-            continuation_token = kwargs.get('ContinuationToken')
-            
-            # Filter keys by prefix
-            matching_keys = [k for k in keys if k.startswith(prefix)]
-            
-            # Handle pagination
-            if continuation_token == "token1":
-                # Second page
-                start_idx = 1000
-                is_truncated = False
-                next_token = None
-            else:
-                # First page
-                start_idx = 0
-                is_truncated = True
-                next_token = "token1"
-            
-            # Get the slice of keys for this page
-            end_idx = min(start_idx + max_keys, len(matching_keys))
-            page_keys = matching_keys[start_idx:end_idx]
-            
-            # Build response
-            contents = [{'Key': key} for key in page_keys]
-            response = {
-                'Contents': contents,
-                'IsTruncated': is_truncated
-            }
-            if next_token:
-                response['NextContinuationToken'] = next_token
-                
-            return response
-        
-        # Replace the method with our mock
-        s3_helper.s3_client.list_objects_v2 = mock_list_objects_v2
-        
-        try:
-            # Test listing all objects
-            result = s3_helper.list_objects(prefix=prefix)
-            
-            # Should return all keys
-            assert len(result) == len(keys)
-            assert sorted(result) == sorted(keys)
-            
-            # Test with max_keys
-            result_limited = s3_helper.list_objects(prefix=prefix, max_keys=500)
-            assert len(result_limited) == 500
-            
-        finally:
-            # Restore the original method
-            s3_helper.s3_client.list_objects_v2 = original_list_objects
+        list_objects_v2 = mock_s3_helper.s3_client.list_objects_v2
+        list_objects_v2.side_effect = [
+            {
+                'Contents': [{'Key': key} for key in keys[:1000]],
+                'IsTruncated': True,
+                'NextContinuationToken': 'token1'
+            },
+            {
+                'Contents': [{'Key': key} for key in keys[1000:]],
+                'IsTruncated': False
+            },
+        ]
+        
+        # Should return all keys, following the continuation token
+        assert mock_s3_helper.list_objects(prefix=prefix) == keys
+        assert list_objects_v2.call_count == 2
+        assert list_objects_v2.call_args.kwargs['ContinuationToken'] == 'token1'
+        
+        # With max_keys, a truncated first page that fills the limit is enough
+        list_objects_v2.reset_mock()
+        list_objects_v2.side_effect = [
+            {
+                'Contents': [{'Key': key} for key in keys[:500]],
+                'IsTruncated': True,
+                'NextContinuationToken': 'token1'
+            },
+        ]
+        result_limited = mock_s3_helper.list_objects(prefix=prefix, max_keys=500)
+        assert len(result_limited) == 500
+        assert list_objects_v2.call_count == 1
             
     def test_delete_nonexistent_object(self, s3_helper):
         """
@@ -330,7 +392,7 @@ class TestS3Helper:
         
         # No assertion needed - the test passes if no exception is raised
         
-    def test_put_object_with_empty_content(self, s3_helper):
+    def test_put_object_with_empty_content(self, s3_helper, in_memory_s3):
         """
         Test putting an object with empty content.
         
@@ -357,69 +419,77 @@ class TestS3Helper:
         # Should return an empty list
         assert result == []
         
-    def test_put_object_upload_error(self, s3_helper):
-        """
-        Test handling of upload errors.
-        
-        This test verifies that S3UploadError is raised when the upload fails.
-        """
-        # Mock the put_object method to raise an exception
-        with patch.object(s3_helper.s3_client, 'put_object', side_effect=Exception("Upload failed")):
-            with pytest.raises(S3UploadError) as exc_info:
-                s3_helper.put_object(TEST_KEY, TEST_CONTENT)
+    @pytest.mark.parametrize(
+        "method,side_effect,call,expected_exc,message",
+        [
+            (
+                "put_object",
+                Exception("Upload failed"),
+                lambda h: h.put_object(TEST_KEY, TEST_CONTENT),
+                S3UploadError,
+                "Failed to upload object",
+            ),
+            (
+                "get_object",
+                GET_ACCESS_DENIED,
+                lambda h: h.get_object(TEST_KEY),
+                S3DownloadError,
+                "Failed to get object",
+            ),
+            (
+                "get_object",
+                RuntimeError("Unexpected error"),
+                lambda h: h.get_object(TEST_KEY),
+                S3DownloadError,
+                "Unexpected error getting object",
+            ),
+            (
+                "head_object",
+                HEAD_ACCESS_DENIED,
+                lambda h: h.object_exists(TEST_KEY),
+                S3DownloadError,
+                "Error checking object existence",
+            ),
+            (
+                "list_objects_v2",
+                Exception("Listing failed"),
+                lambda h: h.list_objects(prefix="test/"),
+                S3Error,
+                "Failed to list objects",
+            ),
+            (
+                "delete_object",
+                Exception("Delete failed"),
+                lambda h: h.delete_object(TEST_KEY),
+                S3UploadError,
+                "Failed to delete object",
+            ),
+        ],
+        ids=[
+            "put_object_upload_error",
+            "get_object_download_error",
+            "get_object_unexpected_error",
+            "object_exists_error",
+            "list_objects_error",
+            "delete_object_error",
+        ],
+    )
+    def test_client_error_paths(self, s3_helper, method, side_effect, call, expected_exc, message):
+        """
+        Test that client failures are wrapped in the helper's exceptions.
+        
+        Each case patches one S3 client method to fail and verifies that the
+        corresponding helper method raises the expected error with a useful
+        message. Non-404/NoSuchKey ClientErrors must not be treated as
+        "missing object".
+        """
+        with patch.object(s3_helper.s3_client, method, side_effect=side_effect):
+            with pytest.raises(expected_exc) as exc_info:
+                call(s3_helper)
             
-            assert "Failed to upload object" in str(exc_info.value)
+            assert message in str(exc_info.value)
             
-    def test_get_object_download_error(self, s3_helper):
-        """
-        Test handling of download errors.
-        
-        This test verifies that S3DownloadError is raised when the download fails
-        with an error other than NoSuchKey.
-        """
-        # Create a ClientError with a non-NoSuchKey error code
-        error_response = {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}
-        client_error = ClientError(error_response, 'GetObject')
-        
-        # Mock the get_object method to raise the client error
-        with patch.object(s3_helper.s3_client, 'get_object', side_effect=client_error):
-            with pytest.raises(S3DownloadError) as exc_info:
-                s3_helper.get_object(TEST_KEY)
-            
-            assert "Failed to get object" in str(exc_info.value)
-            
-    def test_object_exists_error(self, s3_helper):
-        """
-        Test handling of errors in object_exists.
-        
-        This test verifies that S3DownloadError is raised when head_object fails
-        with an error other than 404.
-        """
-        # Create a ClientError with a non-404 error code
-        error_response = {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}
-        client_error = ClientError(error_response, 'HeadObject')
-        
-        # Mock the head_object method to raise the client error
-        with patch.object(s3_helper.s3_client, 'head_object', side_effect=client_error):
-            with pytest.raises(S3DownloadError) as exc_info:
-                s3_helper.object_exists(TEST_KEY)
-            
-            assert "Error checking object existence" in str(exc_info.value)
-            
-    def test_list_objects_error(self, s3_helper):
-        """
-        Test handling of errors in list_objects.
-        
-        This test verifies that S3Error is raised when list_objects_v2 fails.
-        """
-        # Mock the list_objects_v2 method to raise an exception
-        with patch.object(s3_helper.s3_client, 'list_objects_v2', side_effect=Exception("Listing failed")):
-            with pytest.raises(S3Error) as exc_info:
-                s3_helper.list_objects(prefix="test/")
-            
-            assert "Failed to list objects" in str(exc_info.value)
-            
-    def test_complex_json_serialization(self, s3_helper):
+    def test_complex_json_serialization(self, s3_helper, in_memory_s3):
         """
         Test handling of complex JSON data with custom types.
         
@@ -449,217 +519,39 @@ class TestS3Helper:
         assert "nested" in result
         assert "updated_at" in result["nested"]
 
-    def test_get_object_unexpected_error(self, s3_helper):
-        """
-        Test handling of unexpected errors in get_object.
-        
-        This test verifies that S3DownloadError is raised when get_object
-        encounters an unexpected error.
-        """
-        # Mock the get_object method to raise an unexpected exception
-        with patch.object(s3_helper.s3_client, 'get_object', side_effect=RuntimeError("Unexpected error")):
-            with pytest.raises(S3DownloadError) as exc_info:
-                s3_helper.get_object(TEST_KEY)
-            
-            assert "Unexpected error getting object" in str(exc_info.value)
-    
-    def test_list_objects_max_keys_already_reached(self, s3_helper):
-        """
-        Test list_objects when max_keys is already reached.
-        
-        This test verifies that the method handles the case where max_keys
-        is already reached before making another API call.
-        """
-        # Create a few objects
-        prefix = "test/max_keys/"
-        keys = [f"{prefix}file{i}.txt" for i in range(3)]
-        
-        for key in keys:
-            s3_helper.put_object(key, TEST_CONTENT)
-        
-        # Mock the list_objects_v2 method to simulate pagination
-        original_list_objects = s3_helper.s3_client.list_objects_v2
-        
-        call_count = 0
-        
-        def mock_list_objects_v2(**kwargs):
-            """Mock implementation that forces a second call with max_keys already reached."""
-            nonlocal call_count
-            call_count += 1
-            
-            if call_count == 1:
-                # First call returns all keys and indicates there are more
-                return {
-                    'Contents': [{'Key': key} for key in keys],
-                    'IsTruncated': True,
-                    'NextContinuationToken': 'token1'
-                }
-            else:
-                # Second call should not be made if max_keys is already reached
-                # But if it is, return an empty result
-                return {
-                    'Contents': [],
-                    'IsTruncated': False
-                }
-        
-        # Replace the method with our mock
-        s3_helper.s3_client.list_objects_v2 = mock_list_objects_v2
-        
-        try:
-            # Test with max_keys exactly matching the number of keys we already have
-            result = s3_helper.list_objects(prefix=prefix, max_keys=3)
-            
-            # Should return all keys and not make a second API call
-            assert len(result) == 3
-            assert call_count == 1
-            
-        finally:
-            # Restore the original method
-            s3_helper.s3_client.list_objects_v2 = original_list_objects
-    
-    def test_delete_object_error(self, s3_helper):
-        """
-        Test handling of errors in delete_object.
-        
-        This test verifies that S3UploadError is raised when delete_object fails.
-        """
-        # Mock the delete_object method to raise an exception
-        with patch.object(s3_helper.s3_client, 'delete_object', side_effect=Exception("Delete failed")):
-            with pytest.raises(S3UploadError) as exc_info:
-                s3_helper.delete_object(TEST_KEY)
-            
-            assert "Failed to delete object" in str(exc_info.value)
-
-    def test_list_objects_max_keys_zero(self, s3_helper):
-        """
-        Test list_objects with max_keys=0.
-        
-        This test verifies that the method handles the case where max_keys is 0,
-        which should result in an early return without making an API call.
-        """
-        # Mock the list_objects_v2 method to track if it's called
-        original_list_objects = s3_helper.s3_client.list_objects_v2
-        mock_list_objects = MagicMock()
-        s3_helper.s3_client.list_objects_v2 = mock_list_objects
-        
-        try:
-            # Test with max_keys=0
-            result = s3_helper.list_objects(prefix="test/", max_keys=0)
-            
-            # Should return an empty list without making an API call
-            assert result == []
-            mock_list_objects.assert_not_called()
-            
-        finally:
-            # Restore the original method
-            s3_helper.s3_client.list_objects_v2 = original_list_objects 
-
-    def test_list_objects_max_keys_less_than_result(self, s3_helper):
-        """
-        Test list_objects when max_keys is less than the number of results.
-        
-        This test verifies that the method handles the case where max_keys is less
-        than the number of results already collected.
-        """
-        # Create a few objects
-        prefix = "test/max_keys_less/"
-        keys = [f"{prefix}file{i}.txt" for i in range(5)]
+    @pytest.mark.parametrize(
+        "max_keys,expected_len,expected_max_keys",
+        [
+            (3, 3, [3]),
+            (2, 2, [2]),
+            (0, 0, []),
+            (4, 4, [4, 1]),
+            (None, 5, [None, None]),
+        ],
+        ids=[
+            "already_reached",
+            "less_than_result",
+            "zero",
+            "calculation",
+            "unlimited",
+        ],
+    )
+    def test_list_objects_max_keys(
+        self, mock_s3_helper, paged_list_objects, max_keys, expected_len, expected_max_keys
+    ):
+        """
+        Test how list_objects applies max_keys across pages.
         
-        for key in keys:
-            s3_helper.put_object(key, TEST_CONTENT)
-        
-        # Mock the list_objects_v2 method to simulate pagination with more results than max_keys
-        original_list_objects = s3_helper.s3_client.list_objects_v2
-        
-        call_count = 0
-        
-        def mock_list_objects_v2(**kwargs):
-            """Mock implementation that forces a second call with max_keys already reached."""
-            nonlocal call_count
-            call_count += 1
-            
-            if call_count == 1:
-                # First call returns 3 keys and indicates there are more
-                return {
-                    'Contents': [{'Key': keys[i]} for i in range(3)],
-                    'IsTruncated': True,
-                    'NextContinuationToken': 'token1'
-                }
-            else:
-                # Second call should not be made if max_keys is already reached
-                # But if it is, return the remaining keys
-                return {
-                    'Contents': [{'Key': keys[i]} for i in range(3, 5)],
-                    'IsTruncated': False
-                }
-        
-        # Replace the method with our mock
-        s3_helper.s3_client.list_objects_v2 = mock_list_objects_v2
-        
-        try:
-            # Test with max_keys exactly matching the number of keys in the first response
-            result = s3_helper.list_objects(prefix=prefix, max_keys=3)
-            
-            # Should return exactly max_keys objects and not make a second API call
-            assert len(result) == 3
-            assert call_count == 1
-            
-            # Test with max_keys less than the number of keys in the first response
-            call_count = 0
-            result = s3_helper.list_objects(prefix=prefix, max_keys=2)
-            
-            # Should return exactly max_keys objects and not make a second API call
-            assert len(result) == 2
-            assert call_count == 1
-            
-        finally:
-            # Restore the original method
-            s3_helper.s3_client.list_objects_v2 = original_list_objects 
-
-    def test_list_objects_max_keys_calculation(self, s3_helper):
-        """
-        Test that MaxKeys is calculated correctly in list_objects.
-        
-        This test specifically targets the line where MaxKeys is calculated
-        as max_keys - len(result).
+        This test verifies that:
+        1. max_keys=0 returns early without an API call
+        2. No further page is requested once max_keys is reached
+        3. MaxKeys is sent as max_keys - len(result) on each request
         """
-        # Create a few objects
-        prefix = "test/max_keys_calc/"
-        keys = [f"{prefix}file{i}.txt" for i in range(5)]
-        
-        for key in keys:
-            s3_helper.put_object(key, TEST_CONTENT)
-        
-        # Mock the list_objects_v2 method to track the MaxKeys parameter
-        original_list_objects = s3_helper.s3_client.list_objects_v2
-        
-        max_keys_values = []
+        result = mock_s3_helper.list_objects(prefix="test/max_keys/", max_keys=max_keys)
         
-        def mock_list_objects_v2(**kwargs):
-            """Mock implementation that tracks MaxKeys values."""
-            # Record the MaxKeys value
-            if 'MaxKeys' in kwargs:
-                max_keys_values.append(kwargs['MaxKeys'])
-            
-            # First call returns 2 keys and indicates there are more
-            return {
-                'Contents': [{'Key': keys[i]} for i in range(2)],
-                'IsTruncated': False
-            }
-        
-        # Replace the method with our mock
-        s3_helper.s3_client.list_objects_v2 = mock_list_objects_v2
-        
-        try:
-            # Test with max_keys=4
-            result = s3_helper.list_objects(prefix=prefix, max_keys=4)
-            
-            # Verify that MaxKeys was set to 4
-            assert max_keys_values[0] == 4
-            
-        finally:
-            # Restore the original method
-            s3_helper.s3_client.list_objects_v2 = original_list_objects 
+        assert result == PAGED_KEYS[:expected_len]
+        sent_max_keys = [call.kwargs.get('MaxKeys') for call in paged_list_objects.call_args_list]
+        assert sent_max_keys == expected_max_keys
 
     def test_calculate_max_keys(self, s3_helper):
         """
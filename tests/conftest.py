@@ -1,16 +1,51 @@
 """
 Pytest configuration file.
 
-This file contains fixtures and configuration for pytest.
-It helps ensure that the src directory is in the Python path
-and that imports work correctly during testing.
+This file contains fixtures shared across the test suite. The src
+directory is put on the Python path by the ``pythonpath`` setting in
+pyproject.toml, so imports work without modifying sys.path here.
 """
 
-import os
-import sys
-from pathlib import Path
+import boto3
+import pytest
 
-# Add the src directory to the Python path if it's not already there
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path)) 
\ No newline at end of file
+# Region used for the mocked AWS credentials below
+TEST_REGION = "us-east-1"
+
+# Fake credentials so boto3 and moto never pick up a real AWS account
+AWS_TEST_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SECURITY_TOKEN": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+    "AWS_DEFAULT_REGION": TEST_REGION,
+}
+
+@pytest.fixture(scope="session", autouse=True)
+def aws_credentials():
+    """
+    Mocked AWS Credentials for moto.
+    
+    The variables are set once for the whole test session and restored
+    when it ends. Tests that need them unset should use ``monkeypatch.delenv``.
+    """
+    mp = pytest.MonkeyPatch()
+    for name, value in AWS_TEST_ENV.items():
+        mp.setenv(name, value)
+    yield
+    mp.undo()
+
+@pytest.fixture(scope="session")
+def boto_session(aws_credentials):
+    """
+    boto3 Session shared by the whole test run.
+    
+    The fake credentials are passed explicitly, so clients created from it
+    skip the credential provider chain, and the session's loaded service
+    models are reused by every client it creates.
+    """
+    return boto3.Session(
+        aws_access_key_id=AWS_TEST_ENV["AWS_ACCESS_KEY_ID"],
+        aws_secret_access_key=AWS_TEST_ENV["AWS_SECRET_ACCESS_KEY"],
+        region_name=TEST_REGION,
+    )
@@ -0,0 +1,92 @@
+"""
+Shared fixtures for the Google helper tests.
+"""
+
+import copy
+import pytest
+from unittest.mock import MagicMock, Mock, patch
+from cws_helpers import GoogleHelper
+from cws_helpers.google_helper import google_helper
+
+
+@pytest.fixture
+def mock_credentials():
+    """Mock Google credentials for testing."""
+    mock_creds = MagicMock()
+    mock_creds.valid = True
+    mock_creds.to_json.return_value = '{"token": "mock_token"}'
+    return mock_creds
+
+
+@pytest.fixture
+def mock_sheets_service():
+    """Mock Google Sheets service for testing."""
+    mock_service = MagicMock()
+    mock_values = MagicMock()
+    mock_service.spreadsheets.return_value.values.return_value = mock_values
+    return mock_service
+
+
+@pytest.fixture
+def mock_drive_service():
+    """Mock Google Drive service for testing."""
+    mock_service = MagicMock()
+    mock_files = MagicMock()
+    mock_service.files.return_value = mock_files
+    return mock_service
+
+
+@pytest.fixture
+def mock_docs_service():
+    """Mock Google Docs service for testing."""
+    mock_service = MagicMock()
+    mock_documents = MagicMock()
+    mock_service.documents.return_value = mock_documents
+    return mock_service
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials_cache(monkeypatch):
+    """Keep credentials and discovery documents cached by one test from leaking into the next."""
+    GoogleHelper.clear_credentials_cache()
+    monkeypatch.setattr(GoogleHelper, "_discovery_cache", {})
+    yield
+    GoogleHelper.clear_credentials_cache()
+
+
+@pytest.fixture(autouse=True)
+def skip_rate_limit_sleep(monkeypatch):
+    """
+    Skip the rate-limit pause after Sheets writes, which would add a second per write.
+
+    Only google_helper's own reference to the time module is replaced, so time.sleep
+    elsewhere (including googleapiclient's retry backoff) is left untouched.
+    """
+    fake_time = Mock(wraps=google_helper.time)
+    fake_time.sleep = Mock()
+    monkeypatch.setattr(google_helper, "time", fake_time)
+
+
+@pytest.fixture(scope="module")
+def helper_template():
+    """A GoogleHelper built once per module without credentials or services."""
+    with patch.object(GoogleHelper, "_get_credentials", return_value=MagicMock()):
+        return GoogleHelper(initialize_services=False)
+
+
+@pytest.fixture
+def make_helper(helper_template):
+    """
+    Build a GoogleHelper whose handlers wrap the given mock services.
+
+    Returns a function ``make_helper(sheets=None, drive=None, docs=None)``. Each
+    helper is a shallow copy of ``helper_template`` with fresh handlers, so no
+    credentials are loaded, no real services are built and no state is shared.
+    """
+    def _make_helper(sheets=None, drive=None, docs=None):
+        helper = copy.copy(helper_template)
+        helper.sheets = GoogleHelper.SheetsHandler(sheets)
+        helper.drive = GoogleHelper.DriveHandler(drive)
+        helper.docs = GoogleHelper.DocsHandler(docs)
+        return helper
+    return _make_helper
@@ -5,46 +5,24 @@ These tests verify the functionality of the GoogleHelper class and its handlers.
 Note: Most tests are mocked to avoid requiring actual Google API credentials.
 """
 
+import copy
+import json
 import pytest
 import os
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import MagicMock, patch
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpMockSequence
 from cws_helpers import GoogleHelper
 
 
 @pytest.fixture
-def mock_credentials():
-    """Mock Google credentials for testing."""
-    mock_creds = MagicMock()
-    mock_creds.valid = True
-    mock_creds.to_json.return_value = '{"token": "mock_token"}'
-    return mock_creds
-
-
-@pytest.fixture
-def mock_sheets_service():
-    """Mock Google Sheets service for testing."""
-    mock_service = MagicMock()
-    mock_values = MagicMock()
-    mock_service.spreadsheets.return_value.values.return_value = mock_values
-    return mock_service
-
-
-@pytest.fixture
-def mock_drive_service():
-    """Mock Google Drive service for testing."""
-    mock_service = MagicMock()
-    mock_files = MagicMock()
-    mock_service.files.return_value = mock_files
-    return mock_service
-
-
-@pytest.fixture
-def mock_docs_service():
-    """Mock Google Docs service for testing."""
-    mock_service = MagicMock()
-    mock_documents = MagicMock()
-    mock_service.documents.return_value = mock_documents
-    return mock_service
+def token_file(tmp_path, monkeypatch):
+    """Run the test from a temporary directory holding a token.json file."""
+    monkeypatch.chdir(tmp_path)
+    token_path = tmp_path / "token.json"
+    token_path.write_text('{"token": "stored_token"}')
+    return token_path
 
 
 class TestGoogleHelper:
@@ -53,12 +31,9 @@ class TestGoogleHelper:
     @patch('cws_helpers.google_helper.google_helper.Credentials')
     @patch('cws_helpers.google_helper.google_helper.InstalledAppFlow')
     @patch('cws_helpers.google_helper.google_helper.build')
-    @patch('cws_helpers.google_helper.google_helper.os.path.exists')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_init(self, mock_file_open, mock_path_exists, mock_build, mock_flow, mock_credentials_class, mock_credentials):
+    def test_init(self, mock_build, mock_flow, mock_credentials_class, mock_credentials, token_file):
         """Test initialization of GoogleHelper."""
         # Arrange
-        mock_path_exists.return_value = True
         mock_credentials_class.from_authorized_user_file.return_value = mock_credentials
         mock_credentials.valid = True
         
@@ -72,90 +47,385 @@ class TestGoogleHelper:
         assert hasattr(helper, 'docs')
         mock_credentials_class.from_authorized_user_file.assert_called_once_with("token.json", helper.scopes)
 
+    @patch('cws_helpers.google_helper.google_helper.build_from_document')
+    def test_services_built_on_first_access(self, mock_build, mock_credentials):
+        """Test that services are only built when their handler is first used."""
+        # Act
+        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
+            helper = GoogleHelper()
+            mock_build.assert_not_called()
+            sheets = helper.sheets
+
+        # Assert
+        assert helper.sheets is sheets
+        assert sheets.service is mock_build.return_value
+        assert mock_build.call_count == 1
+        assert json.loads(mock_build.call_args.args[0])["name"] == "sheets"
+        assert mock_build.call_args.kwargs['credentials'] is mock_credentials
+
+    @patch('cws_helpers.google_helper.google_helper.Credentials')
+    @patch('cws_helpers.google_helper.google_helper.build')
+    def test_init_reuses_cached_credentials(self, mock_build, mock_credentials_class, mock_credentials, token_file):
+        """Test that GoogleHelper instances share credentials loaded from token.json."""
+        # Arrange
+        mock_credentials_class.from_authorized_user_file.return_value = mock_credentials
+
+        # Act
+        first = GoogleHelper()
+        second = GoogleHelper()
+
+        # Assert
+        assert first._credentials is second._credentials
+        assert mock_credentials_class.from_authorized_user_file.call_count == 1
+        assert token_file.read_text() == '{"token": "stored_token"}'
+
+    @patch('cws_helpers.google_helper.google_helper.Credentials')
     @patch('cws_helpers.google_helper.google_helper.build')
+    def test_init_refreshes_expired_cached_credentials(self, mock_build, mock_credentials_class, mock_credentials, token_file):
+        """Test that expired cached credentials are refreshed rather than reloaded."""
+        # Arrange
+        mock_credentials_class.from_authorized_user_file.return_value = mock_credentials
+        GoogleHelper()
+        mock_credentials.valid = False
+        mock_credentials.expired = True
+        mock_credentials.refresh_token = "refresh_token"
+
+        # Act
+        GoogleHelper()
+
+        # Assert
+        assert mock_credentials_class.from_authorized_user_file.call_count == 1
+        assert mock_credentials.refresh.call_count == 1
+        assert token_file.read_text() == '{"token": "mock_token"}'
+
+    @patch('cws_helpers.google_helper.google_helper.discovery_cache.get_static_doc')
+    @patch('cws_helpers.google_helper.google_helper.build_from_document')
     @patch('cws_helpers.google_helper.google_helper.os.path.exists')
-    def test_get_service(self, mock_path_exists, mock_build, mock_credentials):
-        """Test _get_service method."""
+    def test_get_service(self, mock_path_exists, mock_build, mock_get_static_doc, mock_credentials):
+        """Test _get_service builds a client per call from a shared discovery document."""
         # Arrange
         mock_path_exists.return_value = True
-        mock_build.return_value = "mock_service"
-        mock_build.reset_mock()  # Reset the mock to clear previous calls
+        mock_get_static_doc.return_value = '{"name": "sheets", "version": "v4"}'
+        mock_build.side_effect = lambda document, **kwargs: MagicMock()
         
         # Act
         with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
             helper = GoogleHelper(initialize_services=False)  # Skip initializing services
             service = helper._get_service('sheets', 'v4')
-        
+            second_service = GoogleHelper(initialize_services=False)._get_service('sheets', 'v4')
+        
+        # Assert - clients are not shared (they aren't thread-safe), the document is
+        assert second_service is not service
+        mock_get_static_doc.assert_called_once_with('sheets', 'v4')
+        assert mock_build.call_count == 2
+        # Each build parses the text itself, since building changes the parsed document
+        assert [c.args for c in mock_build.call_args_list] == [('{"name": "sheets", "version": "v4"}',)] * 2
+        assert mock_build.call_args.kwargs['credentials'] is mock_credentials
+
+    def test_get_service_leaves_cached_document_unchanged(self, mock_credentials):
+        """Test that building clients doesn't modify the shared discovery document."""
+        # Act
+        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
+            helper = GoogleHelper(initialize_services=False)
+            document = GoogleHelper._get_discovery_document('drive', 'v3')
+            original = copy.deepcopy(document)
+            helper._get_service('drive', 'v3').files()
+            helper._get_service('drive', 'v3').files()
+
         # Assert
-        assert service == "mock_service"
-        mock_build.assert_called_once_with('sheets', 'v4', credentials=mock_credentials)
+        assert GoogleHelper._get_discovery_document('drive', 'v3') == original
+
+    @patch('cws_helpers.google_helper.google_helper.discovery_cache.get_static_doc', return_value=None)
+    @patch('cws_helpers.google_helper.google_helper.build')
+    def test_get_service_without_bundled_document(self, mock_build, mock_get_static_doc, mock_credentials):
+        """Test _get_service falls back to build() for APIs without a bundled document."""
+        # Act
+        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
+            service = GoogleHelper(initialize_services=False)._get_service('customapi', 'v1')
+
+        # Assert
+        assert service is mock_build.return_value
+        assert mock_build.call_args.args == ('customapi', 'v1')
+
+    def test_orjson_model_deserialize(self):
+        """Test that OrjsonModel parses responses like the default JsonModel."""
+        pytest.importorskip("orjson")
+        from cws_helpers.google_helper.google_helper import OrjsonModel
+
+        model = OrjsonModel(data_wrapper=False)
+
+        assert model.deserialize(b'{"files": [{"id": "1", "name": "caf\xc3\xa9"}]}') == {
+            "files": [{"id": "1", "name": "caf\u00e9"}]
+        }
+        assert model.deserialize(b"not json") == "not json"
+        assert OrjsonModel(data_wrapper=True).deserialize(b'{"data": {"id": "1"}}') == {"id": "1"}
 
 
 class TestSheetsHandler:
     """Test cases for the SheetsHandler class."""
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_read_range(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_read_range(self, mock_sheets_service, make_helper):
         """Test read_range method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_get = MagicMock()
         mock_sheets_service.spreadsheets.return_value.values.return_value.get = mock_get
         mock_get.return_value.execute.return_value = {"values": [["A1", "B1"], ["A2", "B2"]]}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            # Create a new SheetsHandler with the mock service
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            result = helper.sheets.read_range(
-                spreadsheet_id="test_id",
-                sheet_name="Sheet1",
-                start_cell="A1",
-                end_cell="B2"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.read_range(
+            spreadsheet_id="test_id",
+            sheet_name="Sheet1",
+            start_cell="A1",
+            end_cell="B2"
+        )
         
         # Assert
         assert result == [["A1", "B1"], ["A2", "B2"]]
-        mock_get.assert_called_once()
+        assert mock_get.call_count == 1
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_write_range(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_read_range_retries_rate_limited_request(self, mock_credentials):
+        """Test that a 429 response is retried instead of failing the read."""
+        # Arrange
+        http = HttpMockSequence([
+            ({"status": "429"}, '{"error": {"code": 429, "message": "Rate limit exceeded"}}'),
+            ({"status": "200"}, '{"values": [["A1", "B1"]]}')
+        ])
+        sheets_service = build("sheets", "v4", http=http, static_discovery=True)
+
+        # Act - googleapiclient reads time.sleep when the request is created, so
+        # patching it here skips the real backoff pause
+        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials), \
+                patch('googleapiclient.http.time.sleep') as mock_sleep:
+            helper = GoogleHelper(initialize_services=False)
+            helper.sheets = GoogleHelper.SheetsHandler(sheets_service)
+            result = helper.sheets.read_range(spreadsheet_id="test_id", range_name="Sheet1!A1:B1")
+
+        # Assert - without a retry the 429 would be logged and [] returned
+        assert result == [["A1", "B1"]]
+        assert mock_sleep.call_count == 1
+
+    def test_write_range(self, mock_sheets_service, make_helper):
         """Test write_range method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_update = MagicMock()
         mock_sheets_service.spreadsheets.return_value.values.return_value.update = mock_update
         mock_update.return_value.execute.return_value = {"updatedCells": 4}
         test_values = [["A1", "B1"], ["A2", "B2"]]
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            # Create a new SheetsHandler with the mock service
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            helper.sheets.write_range(
-                spreadsheet_id="test_id",
-                values=test_values,
-                sheet_name="Sheet1",
-                start_cell="A1"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        helper.sheets.write_range(
+            spreadsheet_id="test_id",
+            values=test_values,
+            sheet_name="Sheet1",
+            start_cell="A1"
+        )
         
         # Assert
-        mock_update.assert_called_once()
-        # Verify the body parameter contains our test values
-        call_args = mock_update.call_args[1]
-        assert call_args["body"]["values"] == test_values
+        mock_update.assert_called_once_with(
+            spreadsheetId="test_id",
+            range="Sheet1!A1",
+            valueInputOption="RAW",
+            body={"values": test_values}
+        )
+
+    def test_read_ranges(self, mock_sheets_service, make_helper):
+        """Test read_ranges reads several ranges with one batchGet call."""
+        # Arrange
+        mock_batch_get = MagicMock()
+        mock_sheets_service.spreadsheets.return_value.values.return_value.batchGet = mock_batch_get
+        mock_batch_get.return_value.execute.return_value = {
+            "valueRanges": [
+                {"range": "Sheet1!A1:B2", "values": [["A1", "B1"], ["A2", "B2"]]},
+                {"range": "Sheet2!A1:A2"}
+            ]
+        }
+
+        # Act
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.read_ranges(
+            spreadsheet_id="test_id",
+            ranges=["Sheet1!A1:B2", "Sheet2!A1:A2"]
+        )
+
+        # Assert
+        assert result == [[["A1", "B1"], ["A2", "B2"]], []]
+        mock_batch_get.assert_called_once_with(
+            spreadsheetId="test_id", ranges=["Sheet1!A1:B2", "Sheet2!A1:A2"]
+        )
+        assert mock_batch_get.return_value.execute.call_count == 1
+
+    def test_iter_range(self, mock_sheets_service, make_helper):
+        """Test iter_range reads rows chunk by chunk until a chunk comes back empty."""
+        # Arrange
+        mock_get = mock_sheets_service.spreadsheets.return_value.values.return_value.get
+        mock_get.return_value.execute.side_effect = [
+            {"values": [["A1"]]},  # Row 2 is empty and trimmed by the API
+            {"values": [["A3"], ["A4"]]},
+            {}
+        ]
+
+        # Act
+        helper = make_helper(sheets=mock_sheets_service)
+        rows = list(helper.sheets.iter_range(spreadsheet_id="test_id", sheet_name="Sheet1", chunk_size=2))
+
+        # Assert
+        assert rows == [["A1"], [], ["A3"], ["A4"]]
+        assert [call.kwargs["range"] for call in mock_get.call_args_list] == [
+            "Sheet1!1:2", "Sheet1!3:4", "Sheet1!5:6"
+        ]
+
+    def test_iter_range_with_end_row(self, mock_sheets_service, make_helper):
+        """Test iter_range stops at end_row without requesting further rows."""
+        # Arrange
+        mock_get = mock_sheets_service.spreadsheets.return_value.values.return_value.get
+        mock_get.return_value.execute.side_effect = [
+            {"values": [["B2"], ["B3"]]},
+            {"values": [["B4"]]}
+        ]
+
+        # Act
+        helper = make_helper(sheets=mock_sheets_service)
+        rows = list(helper.sheets.iter_range(spreadsheet_id="test_id", start_row=2, end_row=4, chunk_size=2))
+
+        # Assert
+        assert rows == [["B2"], ["B3"], ["B4"]]
+        assert [call.kwargs["range"] for call in mock_get.call_args_list] == ["2:3", "4:4"]
+
+    @pytest.mark.parametrize("kwargs", [
+        {"chunk_size": 0},
+        {"chunk_size": -5},
+        {"start_row": 0},
+    ])
+    def test_iter_range_invalid_arguments(self, kwargs, mock_sheets_service, make_helper):
+        """Test iter_range rejects arguments that would never advance, before any request."""
+        # Act & Assert
+        helper = make_helper(sheets=mock_sheets_service)
+        with pytest.raises(ValueError):
+            helper.sheets.iter_range(spreadsheet_id="test_id", **kwargs)
+        mock_sheets_service.spreadsheets.assert_not_called()
+
+    def test_append_row(self, mock_sheets_service, make_helper):
+        """Test append_row finds the end of the data and writes with one append call."""
+        # Arrange
+        mock_append = mock_sheets_service.spreadsheets.return_value.values.return_value.append
+        mock_append.return_value.execute.return_value = {
+            "updates": {"updatedRange": "Sheet1!A5:C5", "updatedRows": 1}
+        }
+
+        # Act
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.append_row(
+            spreadsheet_id="test_id",
+            values=["New", "Data", "Row"],
+            sheet_name="Sheet1"
+        )
+
+        # Assert
+        assert result == "Sheet1!A5:C5"
+        mock_append.assert_called_once_with(
+            spreadsheetId="test_id",
+            range="Sheet1!A:A",
+            valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
+            body={"values": [["New", "Data", "Row"]]}
+        )
+        mock_sheets_service.spreadsheets.return_value.values.return_value.get.assert_not_called()
+
+    @pytest.mark.parametrize("rows_count", [1, 100, 1000])
+    def test_append_rows_single_api_call(self, rows_count, mock_sheets_service, make_helper):
+        """Test append_rows writes every row with a single append call."""
+        # Arrange
+        mock_append = mock_sheets_service.spreadsheets.return_value.values.return_value.append
+        mock_append.return_value.execute.return_value = {
+            "updates": {"updatedRange": f"Sheet1!A2:B{rows_count + 1}"}
+        }
+        rows = [[f"name{i}", i] for i in range(rows_count)]
+
+        # Act
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.append_rows(spreadsheet_id="test_id", rows=rows, sheet_name="Sheet1")
+
+        # Assert
+        assert result == f"Sheet1!A2:B{rows_count + 1}"
+        assert mock_append.call_count == 1
+        assert mock_append.call_args.kwargs["body"]["values"] == rows
+
+    def test_read_ranges_over_http(self, make_helper):
+        """Test read_ranges against a real Sheets client, with only the HTTP layer mocked."""
+        # Arrange
+        http = HttpMockSequence([
+            ({"status": "200"}, json.dumps({
+                "spreadsheetId": "test_id",
+                "valueRanges": [
+                    {"range": "Sheet1!A1:B2", "values": [["A1", "B1"], ["A2", "B2"]]},
+                    {"range": "Sheet2!A1:A2"}
+                ]
+            }))
+        ])
+        sheets_service = build("sheets", "v4", http=http, static_discovery=True)
+
+        # Act
+        helper = make_helper(sheets=sheets_service)
+        result = helper.sheets.read_ranges(spreadsheet_id="test_id", ranges=["Sheet1!A1:B2", "Sheet2!A1:A2"])
+
+        # Assert - the one canned response was used, by a single request
+        assert result == [[["A1", "B1"], ["A2", "B2"]], []]
+        assert http._iterable == []
+
+    def test_write_ranges(self, mock_sheets_service, make_helper):
+        """Test write_ranges writes several ranges with one batchUpdate call."""
+        # Arrange
+        mock_batch_update = MagicMock()
+        mock_sheets_service.spreadsheets.return_value.values.return_value.batchUpdate = mock_batch_update
+        data = {
+            "Sheet1!A1": [["A1", "B1"]],
+            "Sheet2!C3": [["C3"], ["C4"]]
+        }
+
+        # Act
+        helper = make_helper(sheets=mock_sheets_service)
+        helper.sheets.write_ranges(
+            spreadsheet_id="test_id",
+            data=data,
+            rate_limit=0
+        )
+
+        # Assert
+        mock_batch_update.assert_called_once_with(
+            spreadsheetId="test_id",
+            body={
+                "valueInputOption": "RAW",
+                "data": [
+                    {"range": "Sheet1!A1", "values": [["A1", "B1"]]},
+                    {"range": "Sheet2!C3", "values": [["C3"], ["C4"]]}
+                ]
+            }
+        )
+        assert mock_batch_update.return_value.execute.call_count == 1
 
 
 class TestDriveHandler:
     """Test cases for the DriveHandler class."""
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_list_files(self, mock_build, mock_credentials, mock_drive_service):
+    def test_create_folder_not_retried(self, make_helper):
+        """Test that a failed create is not retried, since it may already have been applied."""
+        # Arrange
+        http = HttpMockSequence([
+            ({"status": "503"}, '{"error": {"code": 503, "message": "Backend Error"}}'),
+            ({"status": "200"}, '{"id": "duplicate_folder"}')
+        ])
+        drive_service = build("drive", "v3", http=http, static_discovery=True)
+
+        # Act / Assert
+        helper = make_helper(drive=drive_service)
+        with pytest.raises(HttpError):
+            helper.drive.create_folder(name="New Folder")
+
+    def test_list_files(self, mock_drive_service, make_helper):
         """Test list_files method."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_list = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
         mock_list.return_value.execute.return_value = {
@@ -163,79 +433,76 @@ class TestDriveHandler:
         }
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            # Create a new DriveHandler with the mock service
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.list_files(query="name contains 'File'")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.list_files(query="name contains 'File'")
         
         # Assert
         assert len(result) == 2
         assert result[0]["name"] == "File 1"
         assert result[1]["name"] == "File 2"
-        mock_list.assert_called_once()
+        assert mock_list.call_count == 1
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_list_all_files_recursive(self, mock_build, mock_credentials, mock_drive_service):
+    def test_list_files_includes_shared_drives(self, mock_drive_service):
+        """Test that Drive searches include shared drives unless shared_drives=False."""
+        # Arrange
+        mock_list = mock_drive_service.files.return_value.list
+        mock_list.return_value.execute.return_value = {"files": []}
+
+        # Act
+        GoogleHelper.DriveHandler(mock_drive_service).list_files(query="name contains 'File'")
+        GoogleHelper.DriveHandler(mock_drive_service, shared_drives=False).list_files(query="name contains 'File'")
+
+        # Assert
+        shared_call, personal_call = mock_list.call_args_list
+        assert shared_call.kwargs["supportsAllDrives"] is True
+        assert shared_call.kwargs["includeItemsFromAllDrives"] is True
+        assert "supportsAllDrives" not in personal_call.kwargs
+        assert "includeItemsFromAllDrives" not in personal_call.kwargs
+
+    def test_list_all_files_recursive(self, mock_drive_service, make_helper):
         """Test list_all_files_recursive method."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_list = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
         
-        # Mock first call for files in root
+        # First call lists everything directly under root, files and folders
         first_call_result = {
             "files": [
-                {"id": "file1", "name": "File 1"},
-                {"id": "file2", "name": "File 2"}
+                {"id": "file1", "name": "File 1", "mimeType": "text/plain", "parents": ["root_id"]},
+                {"id": "folder1", "name": "Folder 1",
+                 "mimeType": "application/vnd.google-apps.folder", "parents": ["root_id"]},
+                {"id": "file2", "name": "File 2", "mimeType": "text/plain", "parents": ["root_id"]}
             ]
         }
         
-        # Mock second call for folders in root
+        # Second call lists the next level (the contents of folder1)
         second_call_result = {
             "files": [
-                {"id": "folder1", "name": "Folder 1"}
+                {"id": "file3", "name": "File 3", "mimeType": "text/plain", "parents": ["folder1"]}
             ]
         }
         
-        # Mock third call for files in subfolder
-        third_call_result = {
-            "files": [
-                {"id": "file3", "name": "File 3"}
-            ]
-        }
-        
-        # Mock fourth call for folders in subfolder (empty)
-        fourth_call_result = {
-            "files": []
-        }
-        
         # Set up the mock to return different results for different calls
         mock_list.return_value.execute.side_effect = [
-            first_call_result,  # Files in root
-            second_call_result,  # Folders in root
-            third_call_result,   # Files in subfolder
-            fourth_call_result   # Folders in subfolder (empty)
+            first_call_result,   # Level 1: children of root
+            second_call_result   # Level 2: children of folder1
         ]
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.list_all_files_recursive(folder_id="root")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.list_all_files_recursive(folder_id="root")
         
         # Assert
         assert len(result) == 3
         assert result[0] == ("file1", "File 1")
         assert result[1] == ("file2", "File 2")
         assert result[2] == ("file3", "File 3")
-        assert mock_list.call_count == 4
+        assert mock_list.call_count == 2
+        assert mock_list.call_args_list[1][1]["q"] == "'folder1' in parents"
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_folder_id(self, mock_build, mock_credentials, mock_drive_service):
+    def test_get_folder_id(self, mock_drive_service, make_helper):
         """Test get_folder_id method."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_list = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
         mock_list.return_value.execute.return_value = {
@@ -243,20 +510,16 @@ class TestDriveHandler:
         }
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.get_folder_id(folder_name="Test Folder")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.get_folder_id(folder_name="Test Folder")
         
         # Assert
         assert result == "folder1"
-        mock_list.assert_called_once()
+        assert mock_list.call_count == 1
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_folder_id_create_if_missing(self, mock_build, mock_credentials, mock_drive_service):
+    def test_get_folder_id_create_if_missing(self, mock_drive_service, make_helper):
         """Test get_folder_id method with create_if_missing=True."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_list = MagicMock()
         mock_create = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
@@ -269,51 +532,88 @@ class TestDriveHandler:
         mock_create.return_value.execute.return_value = {"id": "new_folder", "name": "New Folder", "mimeType": "application/vnd.google-apps.folder"}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.get_folder_id(folder_name="New Folder", create_if_missing=True)
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.get_folder_id(folder_name="New Folder", create_if_missing=True)
         
         # Assert
         assert result == "new_folder"
-        mock_list.assert_called_once()
-        mock_create.assert_called_once()
+        assert mock_list.call_count == 1
+        assert mock_create.call_count == 1
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_file_id(self, mock_build, mock_credentials, mock_drive_service):
-        """Test get_file_id method."""
+    def test_get_folder_id_cached(self, mock_drive_service, make_helper):
+        """Test that repeat get_folder_id lookups are served from the cache until the folder is deleted."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_list = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
-        
-        # First call for folder lookup
-        first_call_result = {
+        mock_list.return_value.execute.return_value = {
             "files": [{"id": "folder1", "name": "Test Folder"}]
         }
+
+        # Act
+        helper = make_helper(drive=mock_drive_service)
+        first = helper.drive.get_folder_id(folder_name="Test Folder")
+        second = helper.drive.get_folder_id(folder_name="Test Folder")
+        calls_before_delete = mock_list.call_count
+        helper.drive.delete_file("folder1")
+        helper.drive.get_folder_id(folder_name="Test Folder")
+
+        # Assert
+        assert first == second == "folder1"
+        assert calls_before_delete == 1
+        assert mock_list.call_count == 2
+
+    def test_get_file_id(self, mock_drive_service, make_helper):
+        """Test get_file_id method."""
+        # Arrange
+        mock_list = MagicMock()
+        mock_drive_service.files.return_value.list = mock_list
         
-        # Second call for file lookup
-        second_call_result = {
-            "files": [{"id": "file1", "name": "Test File"}]
+        # A single call returns the folder and every file with the requested name
+        mock_list.return_value.execute.return_value = {
+            "files": [
+                {"id": "folder1", "name": "Test Folder",
+                 "mimeType": "application/vnd.google-apps.folder", "parents": ["0AReal_Root_Id"]},
+                {"id": "other_file", "name": "Test File",
+                 "mimeType": "text/plain", "parents": ["other_folder"]},
+                {"id": "file1", "name": "Test File",
+                 "mimeType": "text/plain", "parents": ["folder1"]}
+            ]
         }
         
-        mock_list.return_value.execute.side_effect = [first_call_result, second_call_result]
-        
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.get_file_id(file_name="Test File", folder_name="Test Folder")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.get_file_id(file_name="Test File", folder_name="Test Folder")
         
+        # Assert
+        assert result == "file1"
+        assert mock_list.call_count == 1
+        query = mock_list.call_args[1]["q"]
+        assert "name='Test Folder'" in query
+        assert " or " in query
+        assert "name='Test File'" in query
+
+    def test_get_file_id_same_name_as_folder(self, mock_drive_service, make_helper):
+        """Test get_file_id resolves the folder separately when it shares the file's name."""
+        # Arrange
+        mock_list = MagicMock()
+        mock_drive_service.files.return_value.list = mock_list
+        mock_list.return_value.execute.side_effect = [
+            {"files": [{"id": "folder1", "name": "Report"}]},
+            {"files": [{"id": "file1", "name": "Report"}]}
+        ]
+
+        # Act
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.get_file_id(file_name="Report", folder_name="Report")
+
         # Assert
         assert result == "file1"
         assert mock_list.call_count == 2
+        assert "'folder1' in parents" in mock_list.call_args.kwargs["q"]
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_list_files_in_folder(self, mock_build, mock_credentials, mock_drive_service):
+    def test_list_files_in_folder(self, mock_drive_service, make_helper):
         """Test list_files_in_folder method."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_list = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
         
@@ -333,10 +633,8 @@ class TestDriveHandler:
         mock_list.return_value.execute.side_effect = [first_call_result, second_call_result]
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            folder_id, files = helper.drive.list_files_in_folder(folder_name="Test Folder")
+        helper = make_helper(drive=mock_drive_service)
+        folder_id, files = helper.drive.list_files_in_folder(folder_name="Test Folder")
         
         # Assert
         assert folder_id == "folder1"
@@ -344,54 +642,61 @@ class TestDriveHandler:
         assert files[0] == ("file1", "File 1")
         assert files[1] == ("file2", "File 2")
         assert mock_list.call_count == 2
+        assert mock_list.call_args.kwargs["fields"] == "files(id, name)"
 
 
 class TestDocsHandler:
     """Test cases for the DocsHandler class."""
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_document(self, mock_build, mock_credentials, mock_docs_service):
+    def test_get_document(self, mock_docs_service, make_helper):
         """Test get_document method."""
         # Arrange
-        mock_build.return_value = mock_docs_service
         mock_get = MagicMock()
         mock_docs_service.documents.return_value.get = mock_get
         mock_get.return_value.execute.return_value = {"documentId": "doc1", "title": "Test Document"}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            # Create a new DocsHandler with the mock service
-            helper.docs = GoogleHelper.DocsHandler(mock_docs_service)
-            result = helper.docs.get_document(document_id="doc1")
+        helper = make_helper(docs=mock_docs_service)
+        result = helper.docs.get_document(document_id="doc1")
         
         # Assert
         assert result["documentId"] == "doc1"
         assert result["title"] == "Test Document"
         mock_get.assert_called_once_with(documentId="doc1")
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_create_document(self, mock_build, mock_credentials, mock_docs_service):
+    def test_get_document_with_fields(self, mock_docs_service, make_helper):
+        """Test get_document passes a field mask through to the Docs API."""
+        # Arrange
+        mock_get = MagicMock()
+        mock_docs_service.documents.return_value.get = mock_get
+        mock_get.return_value.execute.return_value = {"title": "Test Document"}
+
+        # Act
+        helper = make_helper(docs=mock_docs_service)
+        result = helper.docs.get_document(document_id="doc1", fields="title")
+
+        # Assert
+        assert result == {"title": "Test Document"}
+        mock_get.assert_called_once_with(documentId="doc1", fields="title")
+
+    def test_create_document(self, mock_docs_service, make_helper):
         """Test create_document method."""
         # Arrange
-        mock_build.return_value = mock_docs_service
         mock_create = MagicMock()
         mock_docs_service.documents.return_value.create = mock_create
         mock_create.return_value.execute.return_value = {"documentId": "new_doc", "title": "New Document"}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.docs = GoogleHelper.DocsHandler(mock_docs_service)
-            result = helper.docs.create_document(title="New Document")
+        helper = make_helper(docs=mock_docs_service)
+        result = helper.docs.create_document(title="New Document")
         
         # Assert
         assert result["documentId"] == "new_doc"
         assert result["title"] == "New Document"
-        mock_create.assert_called_once()
+        assert mock_create.call_count == 1
 
     @patch('cws_helpers.google_helper.google_helper.build')
-    def test_create_document_in_folder(self, mock_build, mock_credentials, mock_docs_service):
+    def test_create_document_in_folder(self, mock_build, mock_credentials, mock_docs_service, make_helper):
         """Test create_document method with folder_id."""
         # Arrange
         # Mock the Drive service
@@ -400,12 +705,11 @@ class TestDocsHandler:
         mock_drive_create = MagicMock()
         mock_drive_service.files.return_value = mock_drive_files
         mock_drive_files.create = mock_drive_create
-        mock_drive_create.return_value.execute.return_value = {"id": "new_doc"}
+        mock_drive_create.return_value.execute.return_value = {"id": "new_doc", "name": "New Document"}
         
         # Mock the Docs service
         mock_get = MagicMock()
         mock_docs_service.documents.return_value.get = mock_get
-        mock_get.return_value.execute.return_value = {"documentId": "new_doc", "title": "New Document"}
         
         # Set up the build function to return different services based on arguments
         def side_effect(service_type, version, credentials=None):
@@ -420,19 +724,18 @@ class TestDocsHandler:
         mock_docs_service._http.credentials = mock_credentials
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.docs = GoogleHelper.DocsHandler(mock_docs_service)
-            result = helper.docs.create_document(title="New Document", folder_id="folder1")
+        helper = make_helper(docs=mock_docs_service)
+        result = helper.docs.create_document(title="New Document", folder_id="folder1")
         
         # Assert
         assert result["documentId"] == "new_doc"
         assert result["title"] == "New Document"
-        mock_drive_create.assert_called_once()
-        mock_get.assert_called_once_with(documentId="new_doc")
+        assert mock_drive_create.call_count == 1
+        assert mock_drive_create.call_args.kwargs["body"]["parents"] == ["folder1"]
+        assert mock_get.call_count == 0
 
     @patch('cws_helpers.google_helper.google_helper.build')
-    def test_create_or_replace_document(self, mock_build, mock_credentials, mock_docs_service):
+    def test_create_or_replace_document(self, mock_build, mock_credentials, mock_docs_service, make_helper):
         """Test create_or_replace_document method."""
         # Arrange
         # Mock the Drive service
@@ -447,14 +750,17 @@ class TestDocsHandler:
         mock_drive_files.delete = mock_delete
         mock_drive_files.create = mock_create
         
-        # First call to list (folder lookup)
-        first_list_result = {"files": [{"id": "folder1", "name": "Test Folder"}]}
-        
-        # Second call to list (existing file lookup)
-        second_list_result = {"files": [{"id": "old_doc", "name": "Test Document"}]}
-        
-        # Set up the list mock to return different results for different calls
-        mock_list.return_value.execute.side_effect = [first_list_result, second_list_result]
+        # A single list call returns the folder and same-named documents
+        mock_list.return_value.execute.return_value = {
+            "files": [
+                {"id": "folder1", "name": "Test Folder",
+                 "mimeType": "application/vnd.google-apps.folder", "parents": ["root"]},
+                {"id": "old_doc", "name": "Test Document",
+                 "mimeType": "application/vnd.google-apps.document", "parents": ["folder1"]},
+                {"id": "elsewhere_doc", "name": "Test Document",
+                 "mimeType": "application/vnd.google-apps.document", "parents": ["folder2"]}
+            ]
+        }
         
         # Create call result
         mock_create.return_value.execute.return_value = {"id": "new_doc"}
@@ -472,13 +778,48 @@ class TestDocsHandler:
         mock_docs_service._http.credentials = mock_credentials
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.docs = GoogleHelper.DocsHandler(mock_docs_service)
-            result = helper.docs.create_or_replace_document(title="Test Document", folder_name="Test Folder")
+        helper = make_helper(docs=mock_docs_service)
+        result = helper.docs.create_or_replace_document(title="Test Document", folder_name="Test Folder")
         
         # Assert
         assert result == "new_doc"
-        assert mock_list.call_count == 2
-        mock_delete.assert_called_once_with(fileId="old_doc")
-        mock_create.assert_called_once() 
\ No newline at end of file
+        assert mock_list.call_count == 1
+        mock_delete.assert_called_once_with(fileId="old_doc", supportsAllDrives=True)
+        assert mock_create.call_count == 1
+
+    @patch('cws_helpers.google_helper.google_helper.build')
+    def test_docs_handler_reuses_drive_service(self, mock_build, mock_credentials, mock_docs_service, make_helper):
+        """Test that repeated folder operations build the Drive service only once."""
+        # Arrange
+        mock_drive_service = MagicMock()
+        mock_drive_service.files.return_value.create.return_value.execute.return_value = {"id": "new_doc"}
+        mock_drive_service.files.return_value.list.return_value.execute.return_value = {"files": []}
+        mock_build.return_value = mock_drive_service
+        mock_docs_service._http = MagicMock()
+        mock_docs_service._http.credentials = mock_credentials
+
+        # Act
+        helper = make_helper(docs=mock_docs_service)
+        helper.docs.create_document(title="First", folder_id="folder1")
+        helper.docs.create_or_replace_document(title="Second", folder_id="folder1")
+
+        # Assert
+        mock_build.assert_called_once_with('drive', 'v3', credentials=mock_credentials)
+        assert mock_drive_service.files.return_value.create.call_count == 2
+
+    @patch('cws_helpers.google_helper.google_helper.build_from_document')
+    def test_docs_handler_uses_helper_drive_service(self, mock_build, mock_credentials):
+        """Test that GoogleHelper.docs places documents through the helper's Drive service."""
+        # Arrange
+        mock_build.return_value.files.return_value.create.return_value.execute.return_value = {
+            "id": "new_doc", "name": "First"
+        }
+
+        # Act
+        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
+            helper = GoogleHelper()
+            helper.docs.create_document(title="First", folder_id="folder1")
+
+        # Assert
+        assert helper.docs._drive_service is helper.drive_service
+        assert [json.loads(c.args[0])["name"] for c in mock_build.call_args_list] == ['docs', 'drive']
@@ -5,72 +5,35 @@ These tests focus on methods that were not covered in the main test file.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
-from cws_helpers import GoogleHelper
-
-
-@pytest.fixture
-def mock_credentials():
-    """Mock Google credentials for testing."""
-    mock_creds = MagicMock()
-    mock_creds.valid = True
-    mock_creds.to_json.return_value = '{"token": "mock_token"}'
-    return mock_creds
-
-
-@pytest.fixture
-def mock_sheets_service():
-    """Mock Google Sheets service for testing."""
-    mock_service = MagicMock()
-    mock_values = MagicMock()
-    mock_service.spreadsheets.return_value.values.return_value = mock_values
-    mock_service.spreadsheets.return_value.get = MagicMock()
-    return mock_service
-
-
-@pytest.fixture
-def mock_drive_service():
-    """Mock Google Drive service for testing."""
-    mock_service = MagicMock()
-    mock_files = MagicMock()
-    mock_service.files.return_value = mock_files
-    return mock_service
+from unittest.mock import ANY, MagicMock, patch
+from cws_helpers.google_helper import google_helper
 
 
 class TestSheetsHandlerAdditional:
     """Additional test cases for the SheetsHandler class."""
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_clear_range(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_clear_range(self, mock_sheets_service, make_helper):
         """Test clear_range method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_clear = MagicMock()
         mock_sheets_service.spreadsheets.return_value.values.return_value.clear = mock_clear
         mock_clear.return_value.execute.return_value = {"clearedRange": "Sheet1!A1:B10"}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            helper.sheets.clear_range(
-                spreadsheet_id="test_id",
-                sheet_name="Sheet1",
-                start_cell="A1",
-                end_cell="B10"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        helper.sheets.clear_range(
+            spreadsheet_id="test_id",
+            sheet_name="Sheet1",
+            start_cell="A1",
+            end_cell="B10"
+        )
         
         # Assert
-        mock_clear.assert_called_once()
-        call_args = mock_clear.call_args[1]
-        assert call_args["spreadsheetId"] == "test_id"
-        assert call_args["range"] == "Sheet1!A1:B10"
+        mock_clear.assert_called_once_with(spreadsheetId="test_id", range="Sheet1!A1:B10")
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_clear_range_with_preserve_headers(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_clear_range_with_preserve_headers(self, mock_sheets_service, make_helper):
         """Test clear_range method with preserve_headers=True."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_get = MagicMock()
         mock_clear = MagicMock()
         mock_update = MagicMock()
@@ -80,36 +43,36 @@ class TestSheetsHandlerAdditional:
         mock_sheets_service.spreadsheets.return_value.values.return_value.update = mock_update
         
         # Mock the read_range response
-        mock_get.return_value.execute.return_value = {"values": [["Header1", "Header2"], ["Data1", "Data2"]]}
-        mock_clear.return_value.execute.return_value = {"clearedRange": "Sheet1!A1:B10"}
-        mock_update.return_value.execute.return_value = {"updatedCells": 2}
+        mock_get.return_value.execute.return_value = {
+            "values": [["Header1", "Header2"], ["Data1", "Data2"], ["Data3"]]
+        }
+        mock_update.return_value.execute.return_value = {"updatedCells": 3}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            helper.sheets.clear_range(
-                spreadsheet_id="test_id",
-                sheet_name="Sheet1",
-                start_cell="A1",
-                end_cell="B10",
-                preserve_headers=True
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        helper.sheets.clear_range(
+            spreadsheet_id="test_id",
+            sheet_name="Sheet1",
+            start_cell="A1",
+            end_cell="B10",
+            preserve_headers=True
+        )
         
         # Assert
-        mock_get.assert_called_once()
-        mock_clear.assert_called_once()
-        mock_update.assert_called_once()
-        
-        # Verify the update call contains the header row
-        update_call_args = mock_update.call_args[1]
-        assert update_call_args["body"]["values"] == [["Header1", "Header2"]]
+        assert mock_get.call_count == 1
+        mock_clear.assert_not_called()
+        
+        # Verify the update skips the header row (nulls) and blanks the cells below it
+        mock_update.assert_called_once_with(
+            spreadsheetId="test_id",
+            range="Sheet1!A1:B10",
+            valueInputOption="RAW",
+            body={"values": [[None, None], ["", ""], [""]]}
+        )
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_first_sheet_name(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_get_first_sheet_name(self, mock_sheets_service, make_helper):
         """Test get_first_sheet_name method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_get = mock_sheets_service.spreadsheets.return_value.get
         mock_get.return_value.execute.return_value = {
             "sheets": [
@@ -119,152 +82,158 @@ class TestSheetsHandlerAdditional:
         }
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            result = helper.sheets.get_first_sheet_name(spreadsheet_id="test_id")
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.get_first_sheet_name(spreadsheet_id="test_id")
         
         # Assert
         assert result == "FirstSheet"
-        mock_get.assert_called_once()
-        # The actual implementation doesn't specify fields parameter
-        assert mock_get.call_args[1]["spreadsheetId"] == "test_id"
+        mock_get.assert_called_once_with(spreadsheetId="test_id", fields="sheets.properties.title")
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_next_empty_row(self, mock_build, mock_credentials, mock_sheets_service):
-        """Test get_next_empty_row method."""
+    def test_get_first_sheet_name_cached(self, mock_sheets_service, make_helper):
+        """Test get_first_sheet_name reuses a looked-up name until the cache TTL expires."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
-        mock_get = MagicMock()
-        mock_sheets_service.spreadsheets.return_value.values.return_value.get = mock_get
+        mock_get = mock_sheets_service.spreadsheets.return_value.get
+        mock_get.return_value.execute.return_value = {"sheets": [{"properties": {"title": "FirstSheet"}}]}
+        helper = make_helper(sheets=mock_sheets_service)
         
-        # Mock response with data in first 3 rows
-        mock_get.return_value.execute.return_value = {
-            "values": [["data"], ["data"], ["data"]]
-        }
+        # Act - fetched at t=0, reused at t=30, fetched again at t=61
+        with patch.object(google_helper.time, "monotonic", side_effect=[0, 30, 61, 61]):
+            results = [helper.sheets.get_first_sheet_name(spreadsheet_id="test_id") for _ in range(3)]
+        
+        # Assert
+        assert results == ["FirstSheet"] * 3
+        assert mock_get.call_count == 2
+
+    @pytest.mark.parametrize("response,expected", [
+        ({"values": [["data"], ["data"], ["data"]]}, 4),  # Data in the first 3 rows
+        ({}, 1)  # Empty sheet
+    ])
+    def test_get_next_empty_row(self, response, expected, mock_sheets_service, make_helper):
+        """Test get_next_empty_row returns the row after the last value in the column."""
+        # Arrange
+        mock_get = mock_sheets_service.spreadsheets.return_value.values.return_value.get
+        mock_get.return_value.execute.return_value = response
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            result = helper.sheets.get_next_empty_row(
-                spreadsheet_id="test_id",
-                sheet_name="Sheet1",
-                column="A"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.get_next_empty_row(
+            spreadsheet_id="test_id",
+            sheet_name="Sheet1",
+            column="A"
+        )
         
         # Assert
-        assert result == 4  # Should be row 4 (1-indexed)
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args[1]
-        assert call_args["spreadsheetId"] == "test_id"
-        assert call_args["range"] == "Sheet1!A:A"
+        assert result == expected  # 1-indexed row number
+        mock_get.assert_called_once_with(spreadsheetId="test_id", range="Sheet1!A:A")
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_get_next_empty_row_empty_sheet(self, mock_build, mock_credentials, mock_sheets_service):
-        """Test get_next_empty_row method with empty sheet."""
+    def test_get_next_empty_row_first_sheet(self, mock_sheets_service, make_helper):
+        """Test get_next_empty_row reads the first sheet without looking up its name."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
-        mock_get = MagicMock()
-        mock_sheets_service.spreadsheets.return_value.values.return_value.get = mock_get
-        
-        # Mock response with no data
-        mock_get.return_value.execute.return_value = {}
+        mock_get = mock_sheets_service.spreadsheets.return_value.values.return_value.get
+        mock_get.return_value.execute.return_value = {"values": [["Header"], ["Row 2"]]}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            result = helper.sheets.get_next_empty_row(
-                spreadsheet_id="test_id",
-                sheet_name="Sheet1",
-                column="A"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.get_next_empty_row(spreadsheet_id="test_id", column="B")
         
         # Assert
-        assert result == 1  # Should be row 1 for empty sheet
-        mock_get.assert_called_once()
+        assert result == 3
+        mock_get.assert_called_once_with(spreadsheetId="test_id", range="B:B")
+        mock_sheets_service.spreadsheets.return_value.get.assert_not_called()
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_read_sheet(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_read_sheet(self, mock_sheets_service, make_helper):
         """Test read_sheet method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_get = MagicMock()
         mock_sheets_service.spreadsheets.return_value.values.return_value.get = mock_get
         mock_get.return_value.execute.return_value = {"values": [["A1", "B1"], ["A2", "B2"]]}
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            result = helper.sheets.read_sheet(
-                spreadsheet_id="test_id",
-                range_name="Sheet1!A1:B2"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        result = helper.sheets.read_sheet(
+            spreadsheet_id="test_id",
+            range_name="Sheet1!A1:B2"
+        )
         
         # Assert
         assert result == [["A1", "B1"], ["A2", "B2"]]
         mock_get.assert_called_once_with(spreadsheetId="test_id", range="Sheet1!A1:B2")
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_write_sheet(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_write_sheet(self, mock_sheets_service, make_helper):
         """Test write_sheet method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         mock_update = MagicMock()
         mock_sheets_service.spreadsheets.return_value.values.return_value.update = mock_update
         mock_update.return_value.execute.return_value = {"updatedCells": 4}
         test_values = [["A1", "B1"], ["A2", "B2"]]
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            helper.sheets.write_sheet(
-                spreadsheet_id="test_id",
-                values=test_values,
-                range_name="Sheet1!A1"
-            )
+        helper = make_helper(sheets=mock_sheets_service)
+        helper.sheets.write_sheet(
+            spreadsheet_id="test_id",
+            values=test_values,
+            range_name="Sheet1!A1"
+        )
         
         # Assert
-        mock_update.assert_called_once()
-        call_args = mock_update.call_args[1]
-        assert call_args["spreadsheetId"] == "test_id"
-        assert call_args["range"] == "Sheet1!A1"
-        assert call_args["body"]["values"] == test_values
+        mock_update.assert_called_once_with(
+            spreadsheetId="test_id",
+            range="Sheet1!A1",
+            valueInputOption="RAW",
+            body={"values": test_values}
+        )
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_clear_output_sheet(self, mock_build, mock_credentials, mock_sheets_service):
+    def test_clear_output_sheet(self, mock_sheets_service, make_helper):
         """Test clear_output_sheet method."""
         # Arrange
-        mock_build.return_value = mock_sheets_service
         
         # Since clear_output_sheet calls clear_range, we need to patch that method
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.sheets = GoogleHelper.SheetsHandler(mock_sheets_service)
-            
-            # Mock the clear_range method
-            helper.sheets.clear_range = MagicMock()
-            
-            # Act
-            helper.sheets.clear_output_sheet(spreadsheet_id="test_id")
+        helper = make_helper(sheets=mock_sheets_service)
+        
+        # Mock the clear_range method
+        helper.sheets.clear_range = MagicMock()
+        
+        # Act
+        helper.sheets.clear_output_sheet(spreadsheet_id="test_id")
         
         # Assert
         helper.sheets.clear_range.assert_called_once_with(
             "test_id", sheet_name="output", preserve_headers=True
         )
 
+    def test_workflow_write_quota_budget(self, mock_sheets_service, make_helper):
+        """Test a typical output workflow makes one write request per logical operation."""
+        # Arrange
+        values = mock_sheets_service.spreadsheets.return_value.values.return_value
+        values.get.return_value.execute.return_value = {
+            "values": [["Name", "Count"]] + [[f"old{i}", i] for i in range(50)]
+        }
+        values.append.return_value.execute.return_value = {"updates": {"updatedRange": "output!A2:B101"}}
+        rows = [[f"name{i}", i] for i in range(100)]
+        
+        # Act - clear old output, write 100 new rows, then clear a scratch range
+        helper = make_helper(sheets=mock_sheets_service)
+        helper.sheets.clear_output_sheet(spreadsheet_id="test_id")
+        helper.sheets.append_rows(spreadsheet_id="test_id", rows=rows, sheet_name="output")
+        helper.sheets.clear_range(spreadsheet_id="test_id", range_name="scratch!A1:Z100")
+        
+        # Assert - Sheets allows 60 write requests per minute per user
+        write_calls = (
+            values.update.call_count
+            + values.append.call_count
+            + values.clear.call_count
+            + values.batchUpdate.call_count
+            + values.batchClear.call_count
+            + mock_sheets_service.spreadsheets.return_value.batchUpdate.call_count
+        )
+        assert write_calls <= 3
 
 class TestDriveHandlerAdditional:
     """Additional test cases for the DriveHandler class."""
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_create_folder(self, mock_build, mock_credentials, mock_drive_service):
+    def test_create_folder(self, mock_drive_service, make_helper):
         """Test create_folder method."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_create = MagicMock()
         mock_drive_service.files.return_value.create = mock_create
         mock_create.return_value.execute.return_value = {
@@ -274,24 +243,21 @@ class TestDriveHandlerAdditional:
         }
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.create_folder(name="New Folder")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.create_folder(name="New Folder")
         
         # Assert
         assert result["id"] == "new_folder"
         assert result["name"] == "New Folder"
-        mock_create.assert_called_once()
-        call_args = mock_create.call_args[1]
-        assert call_args["body"]["name"] == "New Folder"
-        assert call_args["body"]["mimeType"] == "application/vnd.google-apps.folder"
+        mock_create.assert_called_once_with(
+            body={"name": "New Folder", "mimeType": "application/vnd.google-apps.folder"},
+            fields=ANY,
+            supportsAllDrives=True
+        )
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_create_folder_with_parent(self, mock_build, mock_credentials, mock_drive_service):
+    def test_create_folder_with_parent(self, mock_drive_service, make_helper):
         """Test create_folder method with parent_id."""
         # Arrange
-        mock_build.return_value = mock_drive_service
         mock_create = MagicMock()
         mock_drive_service.files.return_value.create = mock_create
         mock_create.return_value.execute.return_value = {
@@ -302,99 +268,163 @@ class TestDriveHandlerAdditional:
         }
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.create_folder(name="New Subfolder", parent_id="parent_folder")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.create_folder(name="New Subfolder", parent_id="parent_folder")
         
         # Assert
         assert result["id"] == "new_subfolder"
         assert result["name"] == "New Subfolder"
-        mock_create.assert_called_once()
-        call_args = mock_create.call_args[1]
-        assert call_args["body"]["name"] == "New Subfolder"
-        assert call_args["body"]["parents"] == ["parent_folder"]
+        mock_create.assert_called_once_with(
+            body={
+                "name": "New Subfolder",
+                "mimeType": "application/vnd.google-apps.folder",
+                "parents": ["parent_folder"]
+            },
+            fields=ANY,
+            supportsAllDrives=True
+        )
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_delete_file(self, mock_build, mock_credentials, mock_drive_service):
-        """Test delete_file method."""
+    @pytest.mark.parametrize("side_effect,expected", [
+        (None, True),
+        (Exception("File not found"), False)
+    ])
+    def test_delete_file(self, side_effect, expected, mock_drive_service, make_helper):
+        """Test delete_file reports whether the file was deleted."""
         # Arrange
-        mock_build.return_value = mock_drive_service
-        mock_delete = MagicMock()
-        mock_drive_service.files.return_value.delete = mock_delete
+        mock_delete = mock_drive_service.files.return_value.delete
         mock_delete.return_value.execute.return_value = None  # Delete returns empty response
+        mock_delete.return_value.execute.side_effect = side_effect
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.delete_file(file_id="file_to_delete")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.delete_file(file_id="file_to_delete")
         
         # Assert
-        assert result is True
-        mock_delete.assert_called_once_with(fileId="file_to_delete")
+        assert result is expected
+        mock_delete.assert_called_once_with(fileId="file_to_delete", supportsAllDrives=True)
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_delete_file_error(self, mock_build, mock_credentials, mock_drive_service):
-        """Test delete_file method with error."""
+    def test_delete_files_batch(self, mock_drive_service, make_helper):
+        """Test delete_files sends the deletions in batches of up to 100."""
         # Arrange
-        mock_build.return_value = mock_drive_service
-        mock_delete = MagicMock()
-        mock_drive_service.files.return_value.delete = mock_delete
-        mock_delete.return_value.execute.side_effect = Exception("File not found")
+        file_ids = [f"file{i}" for i in range(150)]
+        batches = []
+        
+        def new_batch_http_request(callback):
+            # Each batch reports every request it was given once executed
+            batch = MagicMock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, {}, Exception("File not found") if request_id == "file7" else None)
+                for request_id in added
+            ]
+            batches.append(batch)
+            return batch
+        
+        mock_drive_service.new_batch_http_request.side_effect = new_batch_http_request
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.delete_file(file_id="nonexistent_file")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.delete_files(file_ids)
         
         # Assert
-        assert result is False
-        mock_delete.assert_called_once_with(fileId="nonexistent_file")
+        assert [batch.add.call_count for batch in batches] == [100, 50]
+        for batch in batches:
+            assert batch.execute.call_count == 1
+        assert result == {file_id: file_id != "file7" for file_id in file_ids}
+        mock_drive_service.files.return_value.delete.assert_any_call(fileId="file149", supportsAllDrives=True)
+        mock_drive_service.files.return_value.delete.return_value.execute.assert_not_called()
 
-    @patch('cws_helpers.google_helper.google_helper.build')
-    def test_list_all_folders_recursive(self, mock_build, mock_credentials, mock_drive_service):
-        """Test list_all_folders_recursive method."""
+    def test_list_all_files_recursive_with_file_type(self, mock_drive_service, make_helper):
+        """Test list_all_files_recursive combines sibling folders into one query per level."""
         # Arrange
-        mock_build.return_value = mock_drive_service
+        doc_type = "application/vnd.google-apps.document"
+        folder_type = "application/vnd.google-apps.folder"
         mock_list = MagicMock()
         mock_drive_service.files.return_value.list = mock_list
+        mock_list.return_value.execute.side_effect = [
+            # Level 1: two subfolders of the start folder
+            {"files": [
+                {"id": "folderA", "name": "A", "mimeType": folder_type, "parents": ["start"]},
+                {"id": "folderB", "name": "B", "mimeType": folder_type, "parents": ["start"]}
+            ]},
+            # Level 2: contents of both subfolders in a single response
+            {"files": [
+                {"id": "docB", "name": "Doc B", "mimeType": doc_type, "parents": ["folderB"]},
+                {"id": "docA", "name": "Doc A", "mimeType": doc_type, "parents": ["folderA"]}
+            ]}
+        ]
         
-        # Mock first call for folders in root
-        first_call_result = {
-            "files": [
-                {"id": "folder1", "name": "Folder 1"}
-            ]
-        }
+        # Act
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.list_all_files_recursive(folder_id="start", file_type=doc_type)
         
-        # Mock second call for subfolders in folder1
-        second_call_result = {
-            "files": [
-                {"id": "subfolder1", "name": "Subfolder 1"}
-            ]
-        }
+        # Assert
+        assert result == [("docA", "Doc A"), ("docB", "Doc B")]  # Depth-first, folder by folder
+        assert mock_list.call_count == 2
+        level_two_query = mock_list.call_args_list[1][1]["q"]
+        assert "'folderA' in parents or 'folderB' in parents" in level_two_query
+        assert f"mimeType='{doc_type}'" in level_two_query
+
+    def test_list_all_files_recursive_with_folder_type(self, mock_drive_service, make_helper):
+        """Test list_all_files_recursive returns every folder when file_type is the folder type."""
+        # Arrange
+        folder_type = "application/vnd.google-apps.folder"
+        mock_list = MagicMock()
+        mock_drive_service.files.return_value.list = mock_list
+        mock_list.return_value.execute.side_effect = [
+            {"files": [
+                {"id": "folderA", "name": "A", "mimeType": folder_type, "parents": ["start"]},
+                {"id": "folderB", "name": "B", "mimeType": folder_type, "parents": ["start"]}
+            ]},
+            {"files": [
+                {"id": "folderA1", "name": "A1", "mimeType": folder_type, "parents": ["folderA"]}
+            ]},
+            {"files": []}
+        ]
         
-        # Mock third call for subfolders in subfolder1 (empty)
-        third_call_result = {
-            "files": []
-        }
+        # Act
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.list_all_files_recursive(folder_id="start", file_type=folder_type)
         
-        # Set up the mock to return different results for different calls
+        # Assert
+        assert result == [("folderA", "A"), ("folderB", "B"), ("folderA1", "A1")]
+        assert mock_list.call_count == 3
+
+    def test_list_all_folders_recursive(self, mock_drive_service, make_helper):
+        """Test list_all_folders_recursive method."""
+        # Arrange
+        mock_list = MagicMock()
+        mock_drive_service.files.return_value.list = mock_list
+        
+        # One query per depth level: root, then folder1 and folder2 together, then subfolder1
+        folder = "application/vnd.google-apps.folder"
         mock_list.return_value.execute.side_effect = [
-            first_call_result,   # Folders in root
-            second_call_result,  # Subfolders in folder1
-            third_call_result    # Subfolders in subfolder1 (empty)
+            {"files": [
+                {"id": "folder1", "name": "Folder 1", "mimeType": folder, "parents": ["0ARootId"]},
+                {"id": "folder2", "name": "Folder 2", "mimeType": folder, "parents": ["0ARootId"]}
+            ]},
+            {"files": [
+                {"id": "subfolder1", "name": "Subfolder 1", "mimeType": folder, "parents": ["folder1"]}
+            ]},
+            {"files": []}
         ]
         
         # Act
-        with patch.object(GoogleHelper, '_get_credentials', return_value=mock_credentials):
-            helper = GoogleHelper(initialize_services=False)
-            helper.drive = GoogleHelper.DriveHandler(mock_drive_service)
-            result = helper.drive.list_all_folders_recursive(folder_id="root")
+        helper = make_helper(drive=mock_drive_service)
+        result = helper.drive.list_all_folders_recursive(folder_id="root")
         
         # Assert
-        assert len(result) == 2
-        assert result[0] == ("folder1", "Folder 1")
-        assert result[1] == ("subfolder1", "Subfolder 1")
-        assert mock_list.call_count == 3 
\ No newline at end of file
+        assert result == [
+            ("folder1", "Folder 1"),
+            ("subfolder1", "Subfolder 1"),
+            ("folder2", "Folder 2")
+        ]
+        assert mock_list.call_count == 3
+        second_query = mock_list.call_args_list[1].kwargs["q"]
+        assert "'folder1' in parents or 'folder2' in parents" in second_query
+        assert f"mimeType='{folder}'" in second_query
+        
+        # Only the fields needed to rebuild the tree are requested
+        for list_call in mock_list.call_args_list:
+            assert list_call.kwargs["fields"] == "nextPageToken, files(id, name, mimeType, parents)" 
\ No newline at end of file
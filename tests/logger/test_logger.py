@@ -12,15 +12,44 @@ from cws_helpers.logger import (
     ConsoleFormatter
 )
 
-@pytest.fixture
+class CollectingHandler(logging.Handler):
+    """Handler that keeps each record's message in a list for assertions."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+@pytest.fixture(scope="module")
 def test_handler():
-    """Create a StringIO handler for capturing log output."""
-    string_io = io.StringIO()
-    handler = logging.StreamHandler(string_io)
-    handler.setLevel(logging.INFO)
-    yield handler, string_io
+    """Create a collecting handler for capturing log output, shared by the module."""
+    handler = CollectingHandler(logging.INFO)
+    yield handler
     handler.close()
 
+@pytest.fixture
+def capture(test_handler):
+    """
+    Attach the shared test handler to a logger and return its emptied message list.
+
+    After the test the handler is detached and the logger is dropped from the
+    logging registry, so loggers created by one test don't pile up.
+    """
+    test_handler.messages.clear()
+    attached = []
+
+    def _capture(logger):
+        logger.addHandler(test_handler)
+        attached.append(logger)
+        return test_handler.messages
+
+    yield _capture
+    for logger in attached:
+        logger.removeHandler(test_handler)
+        logging.Logger.manager.loggerDict.pop(logger.name, None)
+
 def test_custom_log_levels():
     """Test that custom log levels are properly registered."""
     assert logging.getLevelName(FINE_LEVEL) == "FINE"
@@ -33,55 +62,62 @@ def test_custom_log_levels():
     assert hasattr(logger, "step")
     assert hasattr(logger, "success")
 
-def test_console_output(test_handler):
+def test_console_output(capture):
     """Test that logs appear in console with correct formatting."""
-    handler, string_io = test_handler
-    
     # Configure logger with our test handler
     logger = logging.getLogger("test_console")
     for h in logger.handlers[:]:
         logger.removeHandler(h)
-    logger.addHandler(handler)
+    messages = capture(logger)
     logger.setLevel(logging.INFO)
     
     # Log a test message
     logger.info("Test info message")
     
-    # Get output and verify
-    output = string_io.getvalue()
-    assert "Test info message" in output
+    # Verify the captured messages
+    assert "Test info message" in messages
 
-def test_file_logging(tmp_path):
+def test_file_logging(tmp_path, monkeypatch):
     """Test that logs are written to file when keep_logs=True."""
+    import cws_helpers.logger.logger as logger_module
+    
+    # Write the "file" to memory, but record where it would have gone
+    opened = {}
+    def fake_file_handler(path, **kwargs):
+        opened["path"] = path
+        opened["stream"] = io.StringIO()
+        return logging.StreamHandler(opened["stream"])
+    monkeypatch.setattr(logger_module, "RotatingFileHandler", fake_file_handler)
+    
     log_dir = tmp_path / "logs"
     logger = configure_logging("test_file", log_level=logging.INFO, 
                               keep_logs=True, log_dir=str(log_dir))
     
     logger.info("Test file message")
     
-    log_file = log_dir / "logs.log"
-    assert log_file.exists()
-    content = log_file.read_text()
+    assert opened["path"] == log_dir / "logs.log"
+    content = opened["stream"].getvalue()
     assert "INFO" in content
     assert "test_file" in content
     assert "Test file message" in content
+    
+    for h in logger.handlers[:]:
+        logger.removeHandler(h)
 
-def test_log_levels_filtering():
+def test_log_levels_filtering(capture):
     """Test that log level filtering works correctly."""
     logger = configure_logging("test_levels", log_level=logging.INFO)
     
-    # Create a handler that captures logs for testing
-    test_handler = logging.StreamHandler(io.StringIO())
-    logger.addHandler(test_handler)
+    # Capture the logger's output for testing
+    messages = capture(logger)
     
     # DEBUG should be filtered out with INFO level
     logger.debug("Debug message")
     # INFO should pass through
     logger.info("Info message")
     
-    output = test_handler.stream.getvalue()
-    assert "Debug message" not in output
-    assert "Info message" in output
+    assert "Debug message" not in messages
+    assert "Info message" in messages
 
 class TestClass:
     """Test class for testing class method context information."""
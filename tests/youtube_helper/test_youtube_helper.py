@@ -57,6 +57,35 @@ def test_custom_initialization():
     assert helper.options['no_warnings'] is False
     assert helper.options['custom_option'] == 'custom_value'
 
+def test_reuse_session_shares_youtube_dl_instance(mock_caption_info):
+    """Test that reuse_session creates one YoutubeDL instance and reuses it across calls."""
+    with patch('yt_dlp.YoutubeDL') as mock_ytdl:
+        mock_ytdl.return_value.extract_info.return_value = mock_caption_info
+        
+        with YoutubeHelper(reuse_session=True) as helper:
+            helper.list_available_captions(SAMPLE_VIDEO_URL)
+            helper.list_available_captions(SAMPLE_VIDEO_URL, return_all_captions=True)
+            
+            mock_ytdl.assert_called_once_with()
+            assert mock_ytdl.return_value.extract_info.call_count == 2
+            mock_ytdl.return_value.close.assert_not_called()
+        
+        # Leaving the context closes the shared session
+        mock_ytdl.return_value.close.assert_called_once()
+        assert helper._ydl is None
+
+def test_without_reuse_session_creates_instance_per_call(mock_caption_info):
+    """Test that a new YoutubeDL instance is created for each call by default."""
+    with patch('yt_dlp.YoutubeDL') as mock_ytdl:
+        mock_ytdl.return_value.__enter__.return_value.extract_info.return_value = mock_caption_info
+        
+        helper = YoutubeHelper()
+        helper.list_available_captions(SAMPLE_VIDEO_URL)
+        helper.list_available_captions(SAMPLE_VIDEO_URL)
+        
+        assert mock_ytdl.call_count == 2
+        assert helper._ydl is None
+
 # ---------------------------- URL Parsing Tests ---------------------------- #
 
 @pytest.mark.parametrize("url", [
@@ -411,6 +440,22 @@ def test_extractor_error(youtube_helper):
         with pytest.raises(YouTubeVideoUnavailable):
             youtube_helper.get_video_info(SAMPLE_VIDEO_URL)
 
+def test_get_video_info_from_dict(youtube_helper, mock_video_info):
+    """Test building video details from an already extracted info dict without calling yt-dlp."""
+    with patch('yt_dlp.YoutubeDL') as mock_ytdl:
+        info = youtube_helper.get_video_info_from_dict(mock_video_info)
+        mock_ytdl.assert_not_called()
+    
+    assert isinstance(info, YTDLPVideoDetails)
+    assert info.id == SAMPLE_VIDEO_ID
+    assert info.title == 'Test Video'
+    assert info.automatic_captions.root['en'][0].ext == CaptionExtension.VTT
+
+def test_get_video_info_from_dict_empty(youtube_helper):
+    """Test that an empty info dict is reported as an unavailable video."""
+    with pytest.raises(YouTubeVideoUnavailable):
+        youtube_helper.get_video_info_from_dict({})
+
 # ---------------------------- Caption Tests ---------------------------- #
 
 @pytest.fixture
@@ -554,6 +599,20 @@ def test_list_available_captions_invalid_url(youtube_helper):
         result_all = youtube_helper.list_available_captions("not_a_url", return_all_captions=True)
         assert result_all == {}
 
+def test_list_captions_from_dict(youtube_helper, mock_caption_info):
+    """Test listing captions from an already extracted info dict without calling yt-dlp."""
+    with patch('yt_dlp.YoutubeDL') as mock_ytdl:
+        preferred_captions = youtube_helper.list_captions_from_dict(mock_caption_info)
+        all_captions = youtube_helper.list_captions_from_dict(mock_caption_info, return_all_captions=True)
+        mock_ytdl.assert_not_called()
+    
+    # Only the preferred English captions are returned by default
+    assert set(preferred_captions) == {'auto-en'}
+    assert set(all_captions) == {'auto-en', 'auto-es', 'fr', 'de'}
+    
+    # Missing info yields no captions
+    assert youtube_helper.list_captions_from_dict(None) == {}
+
 # ---------------------------- Private Method Tests ---------------------------- #
 
 def test_extract_captions_empty():